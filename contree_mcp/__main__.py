@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 import sys
@@ -6,6 +5,12 @@ import sys
 from contree_mcp.arguments import Parser
 from contree_mcp.server import amain
 
+try:
+    # libuv-based loop when the "uvloop" extra is installed, it cuts the overhead of many concurrent polls
+    from uvloop import run
+except ImportError:
+    from asyncio import run  # type: ignore[assignment,unused-ignore]
+
 
 def main() -> None:
     parser = Parser(
@@ -16,7 +21,7 @@ def main() -> None:
 
     logging.basicConfig(level=parser.log_level, format="[%(levelname)s] %(message)s", stream=sys.stderr)
     try:
-        asyncio.run(amain(parser))
+        run(amain(parser))
     except KeyboardInterrupt:
         logging.info("Gracefully exited on keyboard interrupt")
 
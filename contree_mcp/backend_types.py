@@ -2,6 +2,7 @@
 
 from base64 import b64decode, b64encode
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Literal, TypeVar
 from uuid import UUID
 
@@ -110,6 +111,12 @@ class InstanceSpawnResponse(BaseModel):
     uuid: str = Field(description="Operation UUID")
 
 
+# Keyed by the encoded value rather than stored on Stream, so decoding does not affect model equality
+@lru_cache(maxsize=32)
+def _decode_base64_text(value: str) -> str:
+    return b64decode(value).decode("utf-8", errors="replace")
+
+
 class Stream(BaseModel):
     value: str
     encoding: Literal["ascii", "base64"] = "ascii"
@@ -119,7 +126,7 @@ class Stream(BaseModel):
         if self.encoding == "ascii":
             return self.value
         elif self.encoding == "base64":
-            return b64decode(self.value).decode("utf-8", errors="replace")
+            return _decode_base64_text(self.value)
         raise ValueError(f"Unsupported encoding: {self.encoding}")
 
     @classmethod
@@ -18,6 +18,15 @@ from pydantic import BaseModel
 # Pattern: alphanumeric, underscore, dot (for nested paths like "user.name")
 SAFE_FIELD_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_.]*$")
 
+# Builds a whole cache row as a JSON object, so multi-row walks can be aggregated
+# server-side with json_group_array() and decoded with a single json.loads()
+ENTRY_JSON_OBJECT = """
+    json_object(
+        'id', id, 'kind', kind, 'key', key, 'parent_id', parent_id, 'data', json(data),
+        'created_at', created_at, 'updated_at', updated_at
+    )
+"""
+
 
 @dataclass(frozen=True)
 class CacheEntry:
@@ -35,6 +44,11 @@ class CacheEntry:
         row_dict["data"] = MappingProxyType(json.loads(row_dict["data"]))
         return cls(**row_dict)
 
+    @classmethod
+    def from_json_object(cls, obj: dict[str, Any]) -> CacheEntry:
+        obj["data"] = MappingProxyType(obj["data"])
+        return cls(**obj)
+
 
 class Cache:
     DEFAULT_CACHE_DIR = Path.home() / ".cache" / "contree_mcp"
@@ -175,8 +189,22 @@ class Cache:
         async with self.conn.execute("""SELECT * FROM cache WHERE id = ?""", (entry_id,)) as cursor:
             return await cursor.fetchone()  # type: ignore[return-value]
 
+    async def _fetch_json_array(self, query: str, params: tuple[Any, ...]) -> list[Any]:
+        """Run a query returning a single json_group_array() and decode it."""
+        async with self.conn.execute(query, params) as cursor:
+            cursor.row_factory = None
+            row = await cursor.fetchone()
+        if row is None or row[0] is None:
+            return []
+        result: list[Any] = json.loads(row[0])
+        return result
+
+    async def _fetch_json_entries(self, query: str, params: tuple[Any, ...]) -> list[CacheEntry]:
+        """Run a query returning a single json_group_array() of ENTRY_JSON_OBJECT rows."""
+        return [CacheEntry.from_json_object(obj) for obj in await self._fetch_json_array(query, params)]
+
     async def get_ancestors(self, kind: str, key: str, limit: int = 50) -> list[CacheEntry]:
-        query = """
+        query = f"""
             WITH RECURSIVE ancestor_chain(id, kind, key, parent_id, data, created_at, updated_at, depth) AS
                 (
                     SELECT *, 0 FROM cache WHERE kind = ? AND key = ?
@@ -184,25 +212,19 @@ class Cache:
                     SELECT c.*, ac.depth + 1 FROM cache c
                       INNER JOIN ancestor_chain ac ON c.id = ac.parent_id WHERE ac.depth < ?
                 )
-            SELECT id, kind, key, parent_id, data, created_at, updated_at
-            FROM ancestor_chain WHERE depth > 0 ORDER BY depth
+            SELECT json_group_array(json_array(depth, {ENTRY_JSON_OBJECT})) FROM ancestor_chain WHERE depth > 0
         """
-        async with self.conn.execute(query, (kind, key, limit)) as cursor:
-            return await cursor.fetchall()  # type: ignore[return-value]
+        # json_group_array() does not guarantee the order of its input rows, so each entry carries its depth
+        pairs = await self._fetch_json_array(query, (kind, key, limit))
+        return [CacheEntry.from_json_object(obj) for _, obj in sorted(pairs, key=lambda pair: pair[0])]
 
     async def get_children(self, kind: str, parent_key: str, limit: int = 50) -> list[CacheEntry]:
-        parent = await self.get(kind, parent_key)
-        if parent is None:
-            return []
-
-        query = """
+        query = f"""
             WITH RECURSIVE child_chain(id, kind, key, parent_id, data, created_at, updated_at) AS (
-                SELECT * FROM cache WHERE parent_id = ?
+                SELECT * FROM cache WHERE parent_id = (SELECT id FROM cache WHERE kind = ? AND key = ?)
                 UNION ALL
                 SELECT c.* FROM cache c INNER JOIN child_chain cc ON c.parent_id = cc.id
             )
-            SELECT * FROM child_chain LIMIT ?
+            SELECT json_group_array({ENTRY_JSON_OBJECT}) FROM (SELECT * FROM child_chain LIMIT ?)
         """
-
-        async with self.conn.execute(query, (parent.id, limit)) as cursor:
-            return await cursor.fetchall()  # type: ignore[return-value]
+        return await self._fetch_json_entries(query, (kind, parent_key, limit))
@@ -2,12 +2,17 @@ import asyncio
 import base64
 import hashlib
 import importlib.metadata
+import importlib.util
 import json
 import logging
+import math
 import platform
+import random
 import sys
 from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import cached_property
 from io import BytesIO
 from types import MappingProxyType
@@ -47,6 +52,9 @@ OperationTrackingKind = Literal["instance", "image_import"]
 
 log = logging.getLogger(__name__)
 
+# Polls of many operations multiplex over one connection when the "http2" extra is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class StreamResponse:
     __slots__ = ("status", "headers", "body_iter")
@@ -84,20 +92,28 @@ class StructuredResponse(Generic[ModelT]):
         model: type[ModelT],
         payload_limit: int = 64 * 1024,
     ) -> "StructuredResponse[ModelT]":
+        payload = await cls.read_payload(stream_response, payload_limit=payload_limit)
+        return cls.parse(stream_response.status, stream_response.headers, payload, model=model)
+
+    @staticmethod
+    async def read_payload(stream_response: StreamResponse, payload_limit: int = 64 * 1024) -> bytes:
         content_length = int(stream_response.headers.get("Content-Length", "-1"))
         if content_length > payload_limit:
             raise ContreeError(f"Response too large ({content_length} bytes) for streaming response")
         with BytesIO() as stream:
             async for chunk in stream_response:
                 stream.write(chunk)
-            text = stream.getvalue().decode("utf-8").strip()
+            return stream.getvalue()
+
+    @classmethod
+    def parse(cls, status: int, headers: Headers, payload: bytes, model: type[ModelT]) -> "StructuredResponse[ModelT]":
         try:
-            body = model.model_validate(json.loads(text))
+            body = model.model_validate(json.loads(payload.decode("utf-8").strip()))
         except ValueError as e:
             raise ContreeError(f"Streaming response: invalid JSON: {e}") from e
         except Exception as e:
             raise ContreeError(f"Streaming response: failed to parse response: {e}") from e
-        return cls(stream_response.status, stream_response.headers, body)
+        return cls(status, headers, body)
 
 
 class ContreeError(Exception):
@@ -107,6 +123,29 @@ class ContreeError(Exception):
         self.status_code = status_code
 
 
+def parse_retry_after(headers: Headers) -> float | None:
+    """Seconds to wait from a Retry-After header, given as delay seconds or an HTTP date.
+
+    Returns None for a missing or invalid header, including negative and non-finite delays.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        pass
+    else:
+        return delay if math.isfinite(delay) and delay >= 0 else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
 class ContreeClient:
     PYTHON_VERSION = f"{'.'.join(map(str, sys.version_info))}"
     try:
@@ -117,6 +156,12 @@ class ContreeClient:
     OS_NAME = platform.system()
     OS_VERSION = platform.release()
     POLL_CONCURRENCY = 10
+    # Operation polling starts at POLL_INTERVAL_MIN and grows by POLL_BACKOFF up to poll_interval.
+    # A Retry-After from the server replaces the current delay, up to RETRY_AFTER_MAX seconds.
+    POLL_INTERVAL_MIN = 0.05
+    POLL_BACKOFF = 1.25
+    POLL_JITTER = 0.1
+    RETRY_AFTER_MAX = 60.0
 
     HEADERS = (
         ("Content-Type", "application/json"),
@@ -139,15 +184,20 @@ class ContreeClient:
         cache: Cache,
         timeout: float = 30.0,
         poll_interval: float = 1.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.base_url = base_url.rstrip("/") + "/v1"
         self.token = token
         self.timeout = httpx.Timeout(timeout)
+        self._transport = transport
         self._cache = cache
 
         self._poll_interval = poll_interval
         self._poll_semaphore = asyncio.Semaphore(self.POLL_CONCURRENCY)
         self._tracked_operations: dict[str, asyncio.Task[OperationResponse]] = {}
+        self._fetching_operations: dict[str, asyncio.Task[StructuredResponse[OperationResponse]]] = {}
+        # Last raw body and its model per tracked operation, its polls mostly see the same body again
+        self._operation_payloads: dict[str, tuple[bytes, OperationResponse]] = {}
 
     @property
     def cache(self) -> Cache:
@@ -163,7 +213,9 @@ class ContreeClient:
 
     @cached_property
     def session(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(headers=self.headers, timeout=self.timeout)
+        return httpx.AsyncClient(
+            headers=self.headers, timeout=self.timeout, transport=self._transport, http2=HTTP2_AVAILABLE
+        )
 
     async def cancel_incomplete_operations(self) -> None:
         async def try_cancel(op_id: str) -> None:
@@ -587,10 +639,45 @@ class ContreeClient:
         return response.body.operations
 
     async def _fetch_operation(self, operation_id: str) -> OperationResponse:
-        response = await self._request("GET", f"/operations/{operation_id}", model=OperationResponse)
-        result = response.body
-        await self.cache.put("operation", operation_id, result.model_dump())
-        return result
+        response = await self._fetch_operation_response(operation_id)
+        return response.body
+
+    async def _fetch_operation_response(self, operation_id: str) -> "StructuredResponse[OperationResponse]":
+        # Concurrent fetches of one operation share a single request
+        task = self._fetching_operations.get(operation_id)
+        if task is None:
+            task = asyncio.create_task(self._request_operation(operation_id), name=f"fetch-{operation_id[:8]}")
+            self._fetching_operations[operation_id] = task
+            task.add_done_callback(lambda t: self._forget_fetch(operation_id, t))
+        # Shielded, so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _forget_fetch(self, operation_id: str, task: "asyncio.Task[StructuredResponse[OperationResponse]]") -> None:
+        self._fetching_operations.pop(operation_id, None)
+        if not task.cancelled():
+            # Retrieve the exception, awaiting callers still get it, but a fetch left without
+            # callers must not log "Task exception was never retrieved"
+            task.exception()
+
+    async def _request_operation(self, operation_id: str) -> "StructuredResponse[OperationResponse]":
+        async with self._stream_request("GET", f"/operations/{operation_id}") as stream_response:
+            payload = await StructuredResponse.read_payload(stream_response)
+        previous = self._operation_payloads.get(operation_id)
+        if previous is not None and previous[0] == payload:
+            # Nothing changed since the last poll, the model needs no revalidation
+            response = StructuredResponse(stream_response.status, stream_response.headers, previous[1])
+        else:
+            response = StructuredResponse.parse(
+                stream_response.status, stream_response.headers, payload, model=OperationResponse
+            )
+        # Written even when unchanged, so an entry evicted from the cache comes back
+        await self.cache.put("operation", operation_id, response.body.model_dump())
+        # Only the tracker polls repeatedly, and it drops the entry when it exits
+        if self.is_tracked(operation_id) and not response.body.status.is_terminal():
+            self._operation_payloads[operation_id] = (payload, response.body)
+        else:
+            self._operation_payloads.pop(operation_id, None)
+        return response
 
     async def get_operation(self, operation_id: str) -> OperationResponse:
         entry = await self.cache.get("operation", operation_id)
@@ -650,18 +737,28 @@ class ContreeClient:
         metadata: dict[str, Any],
     ) -> OperationResponse:
         try:
-            async with self._poll_semaphore:
-                while True:
-                    result = await self._fetch_operation(operation_id)
-                    if result.status.is_terminal():
-                        log.debug("Operation %s completed: %s", operation_id, result.status.value)
-                        await self._cache_lineage(operation_id, kind, result, metadata)
-                        return result
-                    log.debug("Operation %s still %s", operation_id, result.status.value)
-                    await asyncio.sleep(self._poll_interval)
+            delay = min(self.POLL_INTERVAL_MIN, self._poll_interval)
+            while True:
+                # The semaphore bounds requests in flight, sleeping between polls holds no slot
+                async with self._poll_semaphore:
+                    response = await self._fetch_operation_response(operation_id)
+                result = response.body
+                if result.status.is_terminal():
+                    log.debug("Operation %s completed: %s", operation_id, result.status.value)
+                    await self._cache_lineage(operation_id, kind, result, metadata)
+                    return result
+                log.debug("Operation %s still %s", operation_id, result.status.value)
+                retry_after = parse_retry_after(response.headers)
+                if retry_after is not None:
+                    # The server knows best when to look again, backoff resumes from there
+                    delay = min(max(retry_after, self.POLL_INTERVAL_MIN), self.RETRY_AFTER_MAX)
+                # Jitter keeps operations tracked together from polling in lockstep
+                await asyncio.sleep(delay + random.uniform(0, delay * self.POLL_JITTER))
+                delay = min(delay * self.POLL_BACKOFF, self._poll_interval)
         finally:
             # noinspection PyAsyncCall
             self._tracked_operations.pop(operation_id, None)
+            self._operation_payloads.pop(operation_id, None)
 
     async def _cache_lineage(
         self,
@@ -3,10 +3,7 @@ import logging
 from contextvars import ContextVar
 from typing import Any, Generic, TypeVar, cast
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from contree_mcp.client import ContreeClient
 from contree_mcp.file_cache import FileCache
@@ -37,17 +34,20 @@ CLIENT: StrictContextVar[ContreeClient] = StrictContextVar("CLIENT")
 FILES_CACHE: StrictContextVar[FileCache] = StrictContextVar("FILES_CACHE")
 
 
-class ContextMiddleware(BaseHTTPMiddleware):
+class ContextMiddleware:
+    """Plain ASGI middleware, so requests skip BaseHTTPMiddleware's extra task and memory streams."""
+
     def __init__(self, app: ASGIApp, *, ctx: contextvars.Context) -> None:
-        self.ctx = ctx
-        super().__init__(app)
+        self.app = app
+        self.client = ctx.run(CLIENT.get)
+        self.files_cache = ctx.run(FILES_CACHE.get)
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Uvicorn cleans up contextvars between requests, so we restore them here
-        CLIENT.set(self.ctx.run(CLIENT.get))
-        FILES_CACHE.set(self.ctx.run(FILES_CACHE.get))
+        CLIENT.set(self.client)
+        FILES_CACHE.set(self.files_cache)
         try:
-            return await call_next(request)
-        except Exception as exc:
+            await self.app(scope, receive, send)
+        except Exception:
             log.exception("Exception while handling request")
-            raise exc
+            raise
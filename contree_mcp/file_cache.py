@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import re
 import uuid
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -89,6 +90,7 @@ class FileCache:
             uuid TEXT NOT NULL,
             name TEXT,
             destination TEXT NOT NULL,
+            dirty INTEGER DEFAULT 0 NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
         );
@@ -97,15 +99,17 @@ class FileCache:
 
         CREATE TABLE IF NOT EXISTS directory_state_file (
             id INTEGER PRIMARY KEY,
-            state_id INTEGER NOT NULL REFERENCES directory_state(id) ON DELETE CASCADE,
+            state_id INTEGER NOT NULL REFERENCES directory_state(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
             uuid TEXT NOT NULL,
             target_path TEXT NOT NULL,
             target_mode INTEGER NOT NULL,
             UNIQUE(state_id, target_path)
         );
+        CREATE INDEX IF NOT EXISTS idx_directory_state_file_uuid ON directory_state_file(uuid);
     """
 
     UPLAOD_CONCURRENCY = 10
+    # Dirty states are revalidated on the next sync, all others once this interval has passed
     REVALIDATION_INTERVAL = timedelta(hours=24)
 
     def __init__(self, db_path: Path | None = None, retention_days: int = 120) -> None:
@@ -139,6 +143,10 @@ class FileCache:
                     columns = {row["name"] for row in await cursor.fetchall()}
                 if "updated_at" not in columns:
                     await conn.execute(f"ALTER TABLE {table} ADD COLUMN updated_at TIMESTAMP")
+                # Migration: add dirty flag, existing states get a single revalidation sweep
+                if table == "directory_state" and "dirty" not in columns:
+                    await conn.execute("ALTER TABLE directory_state ADD COLUMN dirty INTEGER DEFAULT 0 NOT NULL")
+                    await conn.execute("UPDATE directory_state SET dirty = 1")
             await conn.commit()
             self.__conn = conn
 
@@ -156,6 +164,22 @@ class FileCache:
     async def __aexit__(self, *args: object) -> None:
         await self.close()
 
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run statements in one explicit transaction, so deferred FK checks happen once at commit.
+
+        The connection is shared, so callers must hold the write lock: a concurrent BEGIN would fail and a
+        concurrent commit or rollback would end this transaction early.
+        """
+        await self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+            # Deferred FK violations surface here and leave the transaction open
+            await self.conn.commit()
+        except BaseException:
+            await self.conn.rollback()
+            raise
+
     @staticmethod
     def traverse_directory_files(root: Path, excludes: Iterable[str]) -> set[FileState]:
         """
@@ -195,35 +219,36 @@ class FileCache:
         async with self.__upload_semaphore:
             output = await client.upload_file(file_state.path.open("rb"))
         path_str = str(file_state.path)
-        await self.conn.execute(
-            """
-            INSERT INTO files (path, size, mtime, ino, mode, sha256, uuid) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (path) DO UPDATE SET
-                size = excluded.size,
-                mtime = excluded.mtime,
-                ino = excluded.ino,
-                mode = excluded.mode,
-                sha256 = excluded.sha256,
-                uuid = excluded.uuid,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (
-                path_str,
-                file_state.size,
-                file_state.mtime_ns,
-                file_state.ino,
-                file_state.mode,
-                output.sha256,
-                output.uuid,
-            ),
-        )
-        await self.conn.commit()
-        # Query by unique path instead of lastrowid, which is unreliable with ON CONFLICT
-        async with self.conn.execute("""SELECT * FROM files WHERE path = ?""", (path_str,)) as cursor:
-            row = await cursor.fetchone()
-            if row is None:
-                raise RuntimeError("Failed to retrieve uploaded file from database")
-            return FileState.from_row(row)
+        async with self.__lock:
+            await self.conn.execute(
+                """
+                INSERT INTO files (path, size, mtime, ino, mode, sha256, uuid) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    size = excluded.size,
+                    mtime = excluded.mtime,
+                    ino = excluded.ino,
+                    mode = excluded.mode,
+                    sha256 = excluded.sha256,
+                    uuid = excluded.uuid,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    path_str,
+                    file_state.size,
+                    file_state.mtime_ns,
+                    file_state.ino,
+                    file_state.mode,
+                    output.sha256,
+                    output.uuid,
+                ),
+            )
+            await self.conn.commit()
+            # Query by unique path instead of lastrowid, which is unreliable with ON CONFLICT
+            async with self.conn.execute("""SELECT * FROM files WHERE path = ?""", (path_str,)) as cursor:
+                row = await cursor.fetchone()
+        if row is None:
+            raise RuntimeError("Failed to retrieve uploaded file from database")
+        return FileState.from_row(row)
 
     async def _update_synced_directory(
         self,
@@ -234,33 +259,32 @@ class FileCache:
         root: Path,
         destination: str,
     ) -> int:
-        async with self.__lock:
-            to_upload = local_files - synced_files  # New or modified local files
-            tasks = []
-            for file_state in to_upload:
-                tasks.append(self._upload_file(client, file_state))
-            uploaded_files = await asyncio.gather(*tasks)
-            # Get unchanged files from synced_files (which have uuid populated).
-            # Cannot use set.intersection() as it may return elements from local_files
-            # (which have uuid=None) depending on set sizes.
-            non_changed_files = [f for f in synced_files if f in local_files]
-
-            await self.conn.execute("""DELETE FROM directory_state_file WHERE state_id = ?""", (directory_state,))
-            for file_state in list(uploaded_files) + list(non_changed_files):
-                relative_path = file_state.path.relative_to(root)
-                target_path = f"{destination}/{relative_path}"
-                await self.conn.execute(
-                    """
-                    INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)
-                    """,
-                    (directory_state, file_state.uuid, target_path, file_state.mode),
-                )
-            await self.conn.execute(
-                "UPDATE directory_state SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+        to_upload = local_files - synced_files  # New or modified local files
+        tasks = []
+        for file_state in to_upload:
+            tasks.append(self._upload_file(client, file_state))
+        uploaded_files = await asyncio.gather(*tasks)
+        # Get unchanged files from synced_files (which have uuid populated).
+        # Cannot use set.intersection() as it may return elements from local_files
+        # (which have uuid=None) depending on set sizes.
+        non_changed_files = [f for f in synced_files if f in local_files]
+
+        async with self.__lock, self._transaction() as conn:
+            await conn.execute("""DELETE FROM directory_state_file WHERE state_id = ?""", (directory_state,))
+            await conn.executemany(
+                """
+                INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (directory_state, f.uuid, f"{destination}/{f.path.relative_to(root)}", f.mode)
+                    for f in list(uploaded_files) + non_changed_files
+                ],
+            )
+            await conn.execute(
+                "UPDATE directory_state SET dirty = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (directory_state,),
             )
-            await self.conn.commit()
-            return directory_state
+        return directory_state
 
     async def _sync_new_directory(
         self,
@@ -271,40 +295,68 @@ class FileCache:
         destination: str,
         name: str | None = None,
     ) -> int:
-        async with self.__lock:
-            cursor = await self.conn.execute(
-                """INSERT INTO directory_state (uuid, name, destination) VALUES (?, ?, ?)""",
+        tasks = []
+        for file_state in local_files:
+            tasks.append(self._upload_file(client, file_state))
+
+        # Upload first: _upload_file commits, which would split the state transaction
+        uploaded_files = await asyncio.gather(*tasks)
+
+        async with self.__lock, self._transaction() as conn:
+            # A concurrent sync of the same directory may have inserted the state while we uploaded
+            await conn.execute(
+                """
+                INSERT INTO directory_state (uuid, name, destination) VALUES (?, ?, ?)
+                ON CONFLICT (uuid) DO UPDATE SET dirty = 0, updated_at = CURRENT_TIMESTAMP
+                """,
                 (path_uuid, name, destination),
             )
-            directory_state_id = cursor.lastrowid
-            if directory_state_id is None:
-                raise RuntimeError("Failed to get lastrowid after insert")
-            tasks = []
-            for file_state in local_files:
-                tasks.append(self._upload_file(client, file_state))
-
-            uploaded_files = await asyncio.gather(*tasks)
-
-            for file_state in uploaded_files:
-                relative_path = file_state.path.relative_to(root)
-                target_path = f"{destination}/{relative_path}"
-                await self.conn.execute(
-                    """
-                    INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)
-                    """,
-                    (directory_state_id, file_state.uuid, target_path, file_state.mode),
-                )
-            await self.conn.commit()
-            return directory_state_id
+            # Query by unique uuid instead of lastrowid, which is unreliable with ON CONFLICT
+            async with conn.execute("""SELECT id FROM directory_state WHERE uuid = ?""", (path_uuid,)) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                raise RuntimeError("Failed to retrieve directory state from database")
+            directory_state_id: int = row["id"]
+            await conn.execute("""DELETE FROM directory_state_file WHERE state_id = ?""", (directory_state_id,))
+            await conn.executemany(
+                """
+                INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (directory_state_id, f.uuid, f"{destination}/{f.path.relative_to(root)}", f.mode)
+                    for f in uploaded_files
+                ],
+            )
+        return directory_state_id
+
+    async def mark_dirty_for_file_uuid(self, file_uuid: str) -> int:
+        """Mark every directory state referencing the file as needing revalidation.
+
+        Call this when the server reports that a file was evicted. Returns the number of
+        directory states marked dirty.
+        """
+        async with self.__lock:
+            return await self._mark_dirty_for_file_uuid(file_uuid)
+
+    async def _mark_dirty_for_file_uuid(self, file_uuid: str) -> int:
+        cursor = await self.conn.execute(
+            """
+            UPDATE directory_state SET dirty = 1
+            WHERE id IN (SELECT state_id FROM directory_state_file WHERE uuid = ?)
+            """,
+            (file_uuid,),
+        )
+        await self.conn.commit()
+        return cursor.rowcount
 
     async def _needs_revalidation(self, directory_state_id: int) -> bool:
-        """Check if directory state needs revalidation (updated_at >24h ago or NULL)."""
+        """Check if directory state needs revalidation (marked dirty, updated_at >24h ago or NULL)."""
         async with self.conn.execute(
-            "SELECT updated_at FROM directory_state WHERE id = ?",
+            "SELECT dirty, updated_at FROM directory_state WHERE id = ?",
             (directory_state_id,),
         ) as cursor:
             row = await cursor.fetchone()
-        if row is None:
+        if row is None or row["dirty"]:
             return True
         updated_at = row["updated_at"]
         if updated_at is None:
@@ -325,11 +377,12 @@ class FileCache:
     ) -> None:
         """Revalidate file hashes against the server and re-upload stale files."""
         if not synced_files:
-            await self.conn.execute(
-                "UPDATE directory_state SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (directory_state_id,),
-            )
-            await self.conn.commit()
+            async with self.__lock:
+                await self.conn.execute(
+                    "UPDATE directory_state SET dirty = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (directory_state_id,),
+                )
+                await self.conn.commit()
             return
 
         # Check all file SHA256 hashes against server in parallel
@@ -343,6 +396,7 @@ class FileCache:
         results = await asyncio.gather(*[check_file(f, h) for f, h in files_with_hash])
         stale_files = [(fs, h) for (fs, _exists), (_, h) in zip(results, files_with_hash, strict=True) if not _exists]
 
+        uploaded: list[FileState] = []
         if stale_files:
             # Invalidate cache entries for stale files
             for file_state, sha256 in stale_files:
@@ -350,24 +404,26 @@ class FileCache:
                 if file_state.uuid:
                     await client.cache.delete("file_exists_by_uuid", file_state.uuid)
 
+            # Other directory states sharing the evicted files must be revalidated too
+            async with self.__lock:
+                for file_state, _ in stale_files:
+                    if file_state.uuid:
+                        await self._mark_dirty_for_file_uuid(file_state.uuid)
+
             # Re-upload stale files
             uploaded = await asyncio.gather(*[self._upload_file(client, f) for f, _ in stale_files])
 
+        async with self.__lock, self._transaction() as conn:
             # Update directory_state_file entries with new UUIDs
-            for file_state in uploaded:
-                relative_path = file_state.path.relative_to(root)
-                target_path = f"{destination}/{relative_path}"
-                await self.conn.execute(
-                    "UPDATE directory_state_file SET uuid = ? WHERE state_id = ? AND target_path = ?",
-                    (file_state.uuid, directory_state_id, target_path),
-                )
-
-        # Touch updated_at to reset the 24h timer
-        await self.conn.execute(
-            "UPDATE directory_state SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-            (directory_state_id,),
-        )
-        await self.conn.commit()
+            await conn.executemany(
+                "UPDATE directory_state_file SET uuid = ? WHERE state_id = ? AND target_path = ?",
+                [(f.uuid, directory_state_id, f"{destination}/{f.path.relative_to(root)}") for f in uploaded],
+            )
+            # Clear the dirty flag and touch updated_at to reset the 24h timer
+            await conn.execute(
+                "UPDATE directory_state SET dirty = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (directory_state_id,),
+            )
 
     async def sync_directory(
         self,
@@ -398,27 +454,32 @@ class FileCache:
         path_uuid = str(uuid.uuid5(uuid.NAMESPACE_URL, path_url))
         local_files = self.traverse_directory_files(path, excludes_list)
 
-        directory_state: int | None = None
-        async with self.conn.execute("""SELECT * FROM directory_state WHERE uuid = ?""", (path_uuid,)) as cursor:
-            row = await cursor.fetchone()
-            directory_state = None if row is None else row["id"]
+        # The lock covers database access only, uploads and server checks run concurrently
+        async with self.__lock:
+            async with self.conn.execute("""SELECT * FROM directory_state WHERE uuid = ?""", (path_uuid,)) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                directory_state = None
+            else:
+                directory_state = int(row["id"])
+                synced_files = await self.get_synced_directory_files(directory_state)
+                # Revalidate if marked dirty or >24h since last sync
+                needs_revalidation = await self._needs_revalidation(directory_state)
 
-        if directory_state is not None:
-            synced_files = await self.get_synced_directory_files(directory_state)
+        if directory_state is None:
+            return await self._sync_new_directory(client, local_files, path_uuid, path, destination, name)
 
-            # Revalidate if >24h since last sync
-            if await self._needs_revalidation(directory_state):
-                await self._revalidate_files(client, directory_state, synced_files, path, destination)
+        if needs_revalidation:
+            await self._revalidate_files(client, directory_state, synced_files, path, destination)
+            async with self.__lock:
                 synced_files = await self.get_synced_directory_files(directory_state)
 
-            if local_files == synced_files:
-                return int(directory_state)
+        if local_files == synced_files:
+            return directory_state
 
-            return await self._update_synced_directory(
-                client, directory_state, local_files, synced_files, path, destination
-            )
-        else:
-            return await self._sync_new_directory(client, local_files, path_uuid, path, destination, name)
+        return await self._update_synced_directory(
+            client, directory_state, local_files, synced_files, path, destination
+        )
 
     async def get_directory_state(self, ds_id: int) -> DirectoryState | None:
         """Get directory state metadata.
@@ -470,6 +531,7 @@ class FileCache:
         if self.retention_days <= 0:
             return
         cutoff = (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).isoformat()
-        await self.conn.execute("DELETE FROM files WHERE created_at < ?", (cutoff,))
-        await self.conn.execute("DELETE FROM directory_state WHERE created_at < ?", (cutoff,))
-        await self.conn.commit()
+        async with self.__lock:
+            await self.conn.execute("DELETE FROM files WHERE created_at < ?", (cutoff,))
+            await self.conn.execute("DELETE FROM directory_state WHERE created_at < ?", (cutoff,))
+            await self.conn.commit()
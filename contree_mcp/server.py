@@ -1,9 +1,11 @@
 import contextvars
 import logging
+import socket
 from contextlib import AsyncExitStack
 from functools import partial
 
 import uvicorn
+from mcp.server import FastMCP
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
@@ -23,7 +25,19 @@ async def index_page(docs_html: str, _: Request) -> HTMLResponse:
     return HTMLResponse(docs_html)
 
 
-async def amain(parser: Parser) -> None:
+async def render_docs_html(mcp: FastMCP, http_port: int) -> str:
+    tools = await mcp.list_tools()
+    templates = await mcp.list_resource_templates()
+    return generate_docs_html(
+        server_instructions=mcp.instructions or "",
+        tools=tools,
+        templates=templates,
+        guides=SECTIONS,
+        http_port=http_port,
+    )
+
+
+async def amain(parser: Parser, sock: socket.socket | None = None) -> None:
     async with AsyncExitStack() as stack:
         # Initialize all dependencies
         files_cache = await stack.enter_async_context(FileCache(db_path=parser.cache.files.expanduser()))
@@ -47,16 +61,7 @@ async def amain(parser: Parser) -> None:
         if parser.mode == ServerMode.HTTP:
             log.info("Starting MCP server on http://%s:%d", parser.http.listen, parser.http.port)
 
-            # Generate docs HTML
-            tools = await mcp.list_tools()
-            templates = await mcp.list_resource_templates()
-            docs_html = generate_docs_html(
-                server_instructions=mcp.instructions or "",
-                tools=tools,
-                templates=templates,
-                guides=SECTIONS,
-                http_port=parser.http.port,
-            )
+            docs_html = await render_docs_html(mcp, parser.http.port)
 
             app = mcp.streamable_http_app()
             app.add_middleware(ContextMiddleware, ctx=contextvars.copy_context())
@@ -69,7 +74,7 @@ async def amain(parser: Parser) -> None:
                 log_level="info",
             )
             server = uvicorn.Server(config)
-            await server.serve()
+            await server.serve(sockets=None if sock is None else [sock])
         elif parser.mode == ServerMode.STDIO:
             log.info("Starting MCP server in stdio mode")
             await mcp.run_stdio_async()
@@ -2,6 +2,9 @@ from pydantic import BaseModel
 
 from contree_mcp.resources.guide import SECTIONS
 
+# SECTIONS is a read-only mapping, so its sorted names are computed once
+AVAILABLE_SECTIONS = tuple(sorted(SECTIONS))
+
 
 class GetGuideOutput(BaseModel):
     section: str
@@ -42,13 +45,15 @@ async def get_guide(section: str) -> GetGuideOutput:
     - contree://guide/{section} - Same content as MCP resource (if your agent supports resources)
     """
 
-    available = sorted(SECTIONS.keys())
-
-    if section not in SECTIONS:
-        raise ValueError(f"Unknown guide section '{section}'. Available sections: {', '.join(available)}")
+    try:
+        content = SECTIONS[section]
+    except KeyError:
+        raise ValueError(
+            f"Unknown guide section '{section}'. Available sections: {', '.join(AVAILABLE_SECTIONS)}"
+        ) from None
 
     return GetGuideOutput(
         section=section,
-        content=SECTIONS[section],
-        available_sections=available,
+        content=content,
+        available_sections=list(AVAILABLE_SECTIONS),
     )
@@ -1,5 +1,4 @@
 import asyncio
-import contextlib
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -57,23 +56,25 @@ async def wait_operations(
                 error=str(e),
             )
 
-    done, pending = await asyncio.wait(
-        list(map(asyncio.create_task, map(wait_one, set(operation_ids)))),
-        return_when=asyncio.ALL_COMPLETED if mode == "all" else asyncio.FIRST_COMPLETED,
-    )
-
-    for task in pending:
-        if not task.done():
-            task.cancel()
-
-    await asyncio.gather(*pending, return_exceptions=True)
-
-    # Explicitly cancel backend operations for ops not yet in results
+    tasks = list(map(asyncio.create_task, map(wait_one, set(operation_ids))))
+    try:
+        done, pending = await asyncio.wait(
+            tasks,
+            return_when=asyncio.ALL_COMPLETED if mode == "all" else asyncio.FIRST_COMPLETED,
+        )
+    finally:
+        # Also on cancellation of this call, so no waiter outlives it
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Explicitly cancel backend operations for ops not yet in results, all at once, ignoring errors
     if mode == "any":
-        for op_id in operation_ids:
-            if op_id not in results:
-                with contextlib.suppress(Exception):
-                    await client.cancel_operation(op_id)
+        await asyncio.gather(
+            *(client.cancel_operation(op_id) for op_id in dict.fromkeys(operation_ids) if op_id not in results),
+            return_exceptions=True,
+        )
 
     cancelled_ids = [op_id for op_id in operation_ids if op_id not in results]
     # timed_out is True only if we have pending tasks AND mode was "all"
@@ -1,17 +1,22 @@
 """Test fixtures for contree-mcp tools."""
 
 import asyncio
+import contextlib
 import json
 import re
 import socket
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from functools import cached_property
 from http import HTTPStatus
+from pathlib import Path
 from typing import Any
 
+import httpx
 import pytest
 import uvicorn
 from pydantic import BaseModel
+from pydantic_core import to_json
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import Response
@@ -135,6 +140,11 @@ class FakeResponse:
     body: BaseModel | list | dict | str | None = None
     headers: tuple[tuple[str, str], ...] = ()
 
+    @cached_property
+    def content(self) -> str:
+        """Serialized body, computed once since fake responses are shared read-only between requests and tests."""
+        return _serialize_body(self.body)
+
 
 # Type alias for fake responses dictionary
 FakeResponses = dict[str, FakeResponse]
@@ -148,8 +158,8 @@ FakeResponses = dict[str, FakeResponse]
 class RouteMatcher:
     """Match request URIs against fake_responses patterns.
 
-    Converts patterns like "GET /images/{uuid}" to regex that matches
-    "GET /images/abc-123".
+    Patterns like "GET /images/{uuid}" match "GET /images/abc-123". Placeholders spanning whole path
+    segments are looked up in a dict keyed by the normalized template, others fall back to regex.
     """
 
     # Regex to find {param} placeholders
@@ -157,15 +167,41 @@ class RouteMatcher:
 
     def __init__(self, responses: FakeResponses):
         self._responses = responses
-        self._compiled: list[tuple[re.Pattern[str], str]] = []
+        self._templates: dict[tuple[str, ...], FakeResponse] = {}
+        self._param_positions: list[frozenset[int]] = []
+        self._compiled: list[tuple[re.Pattern[str], FakeResponse]] = []
+        self._compile_patterns()
+
+    def reset(self, responses: FakeResponses) -> None:
+        """Replace the configured responses, e.g. when a shared server moves to the next test."""
+        self._responses = responses
+        self._templates = {}
+        self._param_positions = []
+        self._compiled = []
         self._compile_patterns()
 
+    @staticmethod
+    def _template_key(method: str, segments: list[str], positions: frozenset[int]) -> tuple[str, ...]:
+        """Key of a path with the segments at ``positions`` replaced by a placeholder."""
+        return (method, *("{}" if i in positions else segment for i, segment in enumerate(segments)))
+
     def _compile_patterns(self) -> None:
-        """Compile all response patterns to regex."""
-        for pattern in self._responses:
-            # Anchor the pattern
-            regex = re.compile(f"^{re.escape(pattern.split()[0])} {self._path_to_regex(pattern)}$")
-            self._compiled.append((regex, pattern))
+        """Index the response patterns with {param} placeholders, plain ones match exactly."""
+        for pattern, response in self._responses.items():
+            if not self._PARAM_PATTERN.search(pattern):
+                continue
+            method, _, path = pattern.partition(" ")
+            segments = path.split("/")
+            positions = frozenset(i for i, segment in enumerate(segments) if self._PARAM_PATTERN.fullmatch(segment))
+            if any(self._PARAM_PATTERN.search(segments[i]) for i in range(len(segments)) if i not in positions):
+                # A placeholder inside a segment, e.g. "/files/{name}.txt"
+                regex = re.compile(f"^{re.escape(method)} {self._path_to_regex(pattern)}$")
+                self._compiled.append((regex, response))
+                continue
+            # First pattern wins, as with a scan in definition order
+            self._templates.setdefault(self._template_key(method, segments, positions), response)
+            if positions not in self._param_positions:
+                self._param_positions.append(positions)
 
     def _path_to_regex(self, pattern: str) -> str:
         """Convert path pattern to regex."""
@@ -198,10 +234,19 @@ class RouteMatcher:
         if uri in self._responses:
             return self._responses[uri]
 
+        # One dict lookup per distinct placeholder layout, usually just one or two
+        segments = path.split("/")
+        for positions in self._param_positions:
+            if any(i >= len(segments) or not segments[i] for i in positions):
+                continue
+            response = self._templates.get(self._template_key(method, segments, positions))
+            if response is not None:
+                return response
+
         # Try pattern matching
-        for regex, pattern in self._compiled:
+        for regex, response in self._compiled:
             if regex.match(uri):
-                return self._responses[pattern]
+                return response
 
         return None
 
@@ -211,100 +256,58 @@ class RouteMatcher:
 # =============================================================================
 
 
-@pytest.fixture
-def fake_server_socket() -> socket.socket:
-    """Create a bound socket for the fake server."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.bind(("127.0.0.1", 0))
-    return sock
+# Base URL for clients on the in-process fake_transport; the host is never resolved
+FAKE_SERVER_URL = "http://fake-contree"
 
 
-@pytest.fixture
-def fake_server_port(fake_server_socket: socket.socket) -> int:
-    """Port the fake server is bound to."""
-    _, port = fake_server_socket.getsockname()
-    return port
+def _serialize_body(body: Any) -> str:
+    """Serialize response body to JSON string, pydantic models nested in lists and dicts included."""
+    if body is None:
+        return ""
+    if isinstance(body, (BaseModel, list, dict, bool)):
+        return to_json(body).decode()
+    return str(body)
 
 
-@pytest.fixture
-def fake_server_url(fake_server_port: int) -> str:
-    """URL for the fake server."""
-    return f"http://127.0.0.1:{fake_server_port}"
+def fake_reply(matcher: RouteMatcher, method: str, path: str) -> tuple[int, dict[str, str], str]:
+    """Status, headers and body the fake server answers a request with."""
+    # Strip /v1 prefix since ContreeClient adds it
+    if path.startswith("/v1"):
+        path = path[3:]  # Remove /v1 prefix
 
+    fake_response = matcher.match(method, path)
 
-def _convert_pydantic(obj: Any) -> Any:
-    """Recursively convert pydantic models to dicts."""
-    if isinstance(obj, BaseModel):
-        return obj.model_dump()
-    if isinstance(obj, dict):
-        return {k: _convert_pydantic(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_convert_pydantic(item) for item in obj]
-    return obj
+    if fake_response is None:
+        return (
+            HTTPStatus.NOT_FOUND.value,
+            {"Content-Type": "application/json"},
+            json.dumps({"error": f"No fake response for {method} {path}"}),
+        )
 
+    headers = dict(fake_response.headers)
 
-def _serialize_body(body: Any) -> str:
-    """Serialize response body to JSON string."""
-    if body is None:
-        return ""
-    if isinstance(body, BaseModel):
-        return body.model_dump_json()
-    if isinstance(body, (list, dict)):
-        return json.dumps(_convert_pydantic(body))
-    if isinstance(body, bool):
-        return json.dumps(body)
-    return str(body)
+    # Set content type if not specified
+    if "content-type" not in {k.lower() for k in headers}:
+        if fake_response.body is None:
+            media_type = "application/json"
+        elif isinstance(fake_response.body, str) and not fake_response.body.startswith("{"):
+            media_type = "text/plain"
+        else:
+            media_type = "application/json"
+        headers["Content-Type"] = media_type
 
+    return fake_response.http_status.value, headers, fake_response.content
 
-@pytest.fixture
-async def http_fake_server(
-    fake_responses: FakeResponses,
-    fake_server_socket: socket.socket,
-) -> AsyncIterator[None]:
-    """Real HTTP server returning configured fake responses.
 
-    Uses pre-bound socket so server is ready immediately after task starts.
-    """
-    matcher = RouteMatcher(fake_responses)
+def make_fake_server_app(matcher: RouteMatcher) -> Starlette:
+    """Starlette app answering every request from the matcher's fake responses."""
 
     async def handle_request(request: Request) -> Response:
         """Handle incoming requests and return configured fake responses."""
-        method = request.method
-        # Strip /v1 prefix since ContreeClient adds it
-        path = request.url.path
-        if path.startswith("/v1"):
-            path = path[3:]  # Remove /v1 prefix
-
-        fake_response = matcher.match(method, path)
-
-        if fake_response is None:
-            return Response(
-                content=json.dumps({"error": f"No fake response for {method} {path}"}),
-                status_code=404,
-                media_type="application/json",
-            )
-
-        content = _serialize_body(fake_response.body)
-        headers = dict(fake_response.headers)
-
-        # Set content type if not specified
-        if "content-type" not in {k.lower() for k in headers}:
-            if fake_response.body is None:
-                media_type = "application/json"
-            elif isinstance(fake_response.body, str) and not fake_response.body.startswith("{"):
-                media_type = "text/plain"
-            else:
-                media_type = "application/json"
-            headers["Content-Type"] = media_type
-
-        return Response(
-            content=content,
-            status_code=fake_response.http_status.value,
-            headers=headers,
-        )
+        status_code, headers, content = fake_reply(matcher, request.method, request.url.path)
+        return Response(content=content, status_code=status_code, headers=headers)
 
-    app = Starlette(
+    return Starlette(
         routes=[
             Route(
                 "/{path:path}",
@@ -314,9 +317,41 @@ async def http_fake_server(
         ],
     )
 
-    config = uvicorn.Config(app, log_level="error")
+
+def make_fake_transport(matcher: RouteMatcher) -> httpx.MockTransport:
+    """In-process transport answering from the matcher's fake responses, without the ASGI app in between."""
+
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        status_code, headers, content = fake_reply(matcher, request.method, request.url.path)
+        return httpx.Response(status_code, headers=headers, content=content)
+
+    return httpx.MockTransport(handle_request)
+
+
+async def start_server(server: uvicorn.Server, sock: socket.socket, timeout: float = 2.0) -> asyncio.Task[None]:
+    """Serve on a pre-bound socket in a background task and wait until startup completes.
+
+    Raises ``TimeoutError`` if startup hangs, or the startup error if the server exits early.
+    """
+    server_task = asyncio.create_task(server.serve(sockets=[sock]))
+
+    async def started() -> None:
+        while not server.started:
+            if server_task.done():
+                await server_task
+                raise RuntimeError("Server exited during startup")
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(started(), timeout)
+    return server_task
+
+
+@contextlib.asynccontextmanager
+async def serve_fake_server(matcher: RouteMatcher, sock: socket.socket) -> AsyncIterator[None]:
+    """Run the fake server on a pre-bound socket."""
+    config = uvicorn.Config(make_fake_server_app(matcher), log_level="error", http="httptools")
     server = uvicorn.Server(config)
-    server_task = asyncio.create_task(server.serve(sockets=[fake_server_socket]))
+    server_task = await start_server(server, sock)
 
     yield
 
@@ -324,32 +359,64 @@ async def http_fake_server(
     await server_task
 
 
-@pytest.fixture
-async def files_cache(tmp_path: Any) -> AsyncIterator[FileCache]:
-    """Standalone FileCache fixture."""
-    async with FileCache(db_path=tmp_path / "files.db") as cache:
+def cache_db_path(request: pytest.FixtureRequest, tmp_path: Path, name: str) -> Path:
+    """SQLite path for cache fixtures: in-memory unless marked ``@pytest.mark.cache_backend("disk")``."""
+    marker = request.node.get_closest_marker("cache_backend")
+    if marker is not None and marker.args and marker.args[0] == "disk":
+        return tmp_path / name
+    return Path(":memory:")
+
+
+@pytest.fixture(scope="module")
+async def module_files_cache(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> AsyncIterator[FileCache]:
+    """FileCache shared by a test module, so its schema is created once per module.
+
+    Being module-scoped, it honours a ``cache_backend`` marker set on the module (``pytestmark``) only.
+    """
+    async with FileCache(db_path=cache_db_path(request, tmp_path_factory.mktemp("files"), "files.db")) as cache:
         yield cache
 
 
 @pytest.fixture
-async def general_cache(tmp_path: Any) -> AsyncIterator[Cache]:
+async def files_cache(module_files_cache: FileCache) -> FileCache:
+    """Standalone FileCache fixture, emptied of the rows left by previous tests in the module."""
+    conn = module_files_cache.conn
+    for table in ("directory_state_file", "directory_state", "files"):
+        await conn.execute(f"DELETE FROM {table}")
+    await conn.commit()
+    return module_files_cache
+
+
+@pytest.fixture
+async def general_cache(request: pytest.FixtureRequest, tmp_path: Path) -> AsyncIterator[Cache]:
     """Standalone Cache fixture."""
-    async with Cache(db_path=tmp_path / "cache.db") as cache:
+    async with Cache(db_path=cache_db_path(request, tmp_path, "cache.db")) as cache:
         yield cache
 
 
+@pytest.fixture(scope="class")
+def fake_transport(fake_responses: FakeResponses) -> httpx.MockTransport:
+    """In-process transport to the fake responses, no socket or uvicorn involved.
+
+    The transport keeps no per-request state, so the compiled routes are shared by all tests of a class.
+    """
+    return make_fake_transport(RouteMatcher(fake_responses))
+
+
 @pytest.fixture
 async def contree_client(
-    http_fake_server: None,
-    fake_server_url: str,
+    fake_transport: httpx.MockTransport,
     files_cache: FileCache,
     general_cache: Cache,
 ) -> AsyncIterator[ContreeClient]:
-    """Real ContreeClient pointing to the fake HTTP server."""
+    """Real ContreeClient answered in process by the fake responses through an httpx.MockTransport."""
     async with ContreeClient(
-        base_url=fake_server_url,
+        base_url=FAKE_SERVER_URL,
         token="test-token",
         cache=general_cache,
+        transport=fake_transport,
     ) as client:
         # Set context variables
         CLIENT.set(client)
@@ -364,12 +431,12 @@ def sample_image() -> Image:
     return make_image(uuid="img-test-123", tag="test:latest")
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def fake_responses() -> FakeResponses:
     """Default empty fake responses for tests that don't need HTTP.
 
     Tests that use cache-based resources (image_lineage, instance_operation,
-    import_operation) still need contree_client, which depends on http_fake_server,
+    import_operation) still need contree_client, which depends on fake_transport,
     which depends on this fixture. This provides an empty default.
     """
     return {}
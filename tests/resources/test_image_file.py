@@ -3,6 +3,7 @@ from http import HTTPStatus
 import pytest
 
 from contree_mcp.backend_types import Image
+from contree_mcp.client import ContreeError
 from contree_mcp.resources.read_file import read_file
 from tests.conftest import FakeResponse, FakeResponses
 
@@ -12,7 +13,7 @@ from . import TestCase
 class TestImageFileHappyPath(TestCase):
     """Tests for image_file resource - happy path."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/": FakeResponse(
@@ -52,7 +53,7 @@ class TestImageFileHappyPath(TestCase):
 class TestImageFileErrorHandling(TestCase):
     """Tests for image_file resource - error handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/{uuid}/": FakeResponse(
@@ -67,17 +68,17 @@ class TestImageFileErrorHandling(TestCase):
     @pytest.mark.asyncio
     async def test_file_not_found(self) -> None:
         """Test error when file does not exist."""
-        with pytest.raises(Exception):  # noqa: B017
+        with pytest.raises(ContreeError, match="File not found"):
             await read_file(image="00000000-0000-0000-0000-000000000001", path="nonexistent/file")
 
 
 class TestImageFileImageNotFound(TestCase):
     """Tests for image_file resource - image not found."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "GET /inspect/{uuid}/": FakeResponse(
+            "GET /inspect/{uuid}/download": FakeResponse(
                 http_status=HTTPStatus.NOT_FOUND,
                 body={"error": "Image not found"},
             ),
@@ -86,5 +87,5 @@ class TestImageFileImageNotFound(TestCase):
     @pytest.mark.asyncio
     async def test_image_not_found(self) -> None:
         """Test error when image does not exist."""
-        with pytest.raises(Exception):  # noqa: B017
-            await read_file(image="nonexistent", path="etc/passwd")
+        with pytest.raises(ContreeError, match="Image not found"):
+            await read_file(image="00000000-0000-0000-0000-000000000404", path="etc/passwd")
@@ -5,6 +5,7 @@ from http import HTTPStatus
 import pytest
 
 from contree_mcp.backend_types import Image
+from contree_mcp.client import ContreeError
 from contree_mcp.resources.image_ls import image_ls
 from tests.conftest import FakeResponse, FakeResponses
 
@@ -26,7 +27,7 @@ lrwxrwxrwx 1 0 0       16 Jan  1 00:00 python -> /usr/bin/python3"""
 class TestImageLsHappyPath(TestCase):
     """Tests for image_ls resource - happy path."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/": FakeResponse(
@@ -71,7 +72,7 @@ class TestImageLsHappyPath(TestCase):
 class TestImageLsRootDirectory(TestCase):
     """Tests for image_ls resource - root directory handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/{uuid}/": FakeResponse(
@@ -98,7 +99,7 @@ class TestImageLsRootDirectory(TestCase):
 class TestImageLsSymlinks(TestCase):
     """Tests for image_ls resource - symlink handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/{uuid}/": FakeResponse(
@@ -119,7 +120,7 @@ class TestImageLsSymlinks(TestCase):
 class TestImageLsErrorHandling(TestCase):
     """Tests for image_ls resource - error handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/{uuid}/": FakeResponse(
@@ -134,5 +135,5 @@ class TestImageLsErrorHandling(TestCase):
     @pytest.mark.asyncio
     async def test_directory_not_found(self) -> None:
         """Test error when directory does not exist."""
-        with pytest.raises(Exception):  # noqa: B017
+        with pytest.raises(ContreeError, match="Directory not found"):
             await image_ls(image="00000000-0000-0000-0000-000000000001", path="nonexistent")
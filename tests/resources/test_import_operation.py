@@ -1,5 +1,7 @@
 """Tests for import_operation resource."""
 
+from http import HTTPStatus
+
 import pytest
 
 from contree_mcp.backend_types import (
@@ -10,6 +12,7 @@ from contree_mcp.backend_types import (
     OperationResult,
     OperationStatus,
 )
+from contree_mcp.client import ContreeError
 from contree_mcp.resources.import_operation import import_operation
 from tests.conftest import FakeResponse, FakeResponses
 
@@ -78,10 +81,8 @@ class TestImportOperationFailed(TestCase):
 class TestImportOperationNotFound(TestCase):
     """Tests for import_operation resource - not found."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
-        from http import HTTPStatus
-
         return {
             "GET /operations/{uuid}": FakeResponse(
                 http_status=HTTPStatus.NOT_FOUND,
@@ -92,8 +93,6 @@ class TestImportOperationNotFound(TestCase):
     @pytest.mark.asyncio
     async def test_import_not_found(self, contree_client) -> None:
         """Test error when import operation is not found."""
-        from contree_mcp.client import ContreeError
-
         with pytest.raises(ContreeError):
             await import_operation(operation_id="nonexistent")
 
@@ -1,6 +1,7 @@
 """Tests for instance_operation resource."""
 
 import json
+from http import HTTPStatus
 
 import pytest
 
@@ -15,6 +16,7 @@ from contree_mcp.backend_types import (
     ProcessExitState,
     Stream,
 )
+from contree_mcp.client import ContreeError
 from contree_mcp.resources.instance_operation import instance_operation
 from tests.conftest import FakeResponse, FakeResponses
 
@@ -99,10 +101,8 @@ class TestInstanceOperationFailed(TestCase):
 class TestInstanceOperationNotFound(TestCase):
     """Tests for instance_operation resource - not found."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
-        from http import HTTPStatus
-
         return {
             "GET /operations/{uuid}": FakeResponse(
                 http_status=HTTPStatus.NOT_FOUND,
@@ -113,8 +113,6 @@ class TestInstanceOperationNotFound(TestCase):
     @pytest.mark.asyncio
     async def test_operation_not_found(self, contree_client) -> None:
         """Test error when operation is not found."""
-        from contree_mcp.client import ContreeError
-
         with pytest.raises(ContreeError):
             await instance_operation(operation_id="nonexistent")
 
@@ -1,11 +1,17 @@
 """Tests for ContreeClient."""
 
+import asyncio
 import base64
 import io
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from contree_mcp.backend_types import (
@@ -15,8 +21,9 @@ from contree_mcp.backend_types import (
     Stream,
 )
 from contree_mcp.cache import Cache
-from contree_mcp.client import ContreeClient, ContreeError
+from contree_mcp.client import ContreeClient, ContreeError, StructuredResponse, parse_retry_after
 from tests.conftest import (
+    FAKE_SERVER_URL,
     FakeResponse,
     FakeResponses,
     make_image,
@@ -31,6 +38,25 @@ async def tmp_cache(tmp_path: Path) -> AsyncIterator[Cache]:
         yield cache
 
 
+MockClientFactory = Callable[..., ContreeClient]
+
+
+@pytest.fixture
+def mock_client(general_cache: Cache) -> MockClientFactory:
+    """Build clients whose requests are answered by a handler through an httpx.MockTransport."""
+
+    def make(handler: Callable[[httpx.Request], httpx.Response], poll_interval: float = 1.0) -> ContreeClient:
+        return ContreeClient(
+            base_url=FAKE_SERVER_URL,
+            token="test-token",
+            cache=general_cache,
+            poll_interval=poll_interval,
+            transport=httpx.MockTransport(handler),
+        )
+
+    return make
+
+
 class TestOperationStatusStr:
     """Tests for OperationStatus.__str__ method."""
 
@@ -77,7 +103,7 @@ class TestContreeClientInit:
 class TestListImages(TestCase):
     """Tests for list_images method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /images": FakeResponse(
@@ -104,7 +130,7 @@ class TestListImages(TestCase):
 class TestListImagesWithFilters(TestCase):
     """Tests for list_images with filters."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /images": FakeResponse(body={"images": []}),
@@ -127,7 +153,7 @@ class TestListImagesWithFilters(TestCase):
 class TestImportImage(TestCase):
     """Tests for import_image method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /images/import": FakeResponse(
@@ -161,7 +187,7 @@ class TestImportImage(TestCase):
 class TestImportImageNoLocation(TestCase):
     """Tests for import_image error when no Location header."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /images/import": FakeResponse(http_status=HTTPStatus.ACCEPTED, body={"uuid": ""}),
@@ -179,7 +205,7 @@ class TestImportImageNoLocation(TestCase):
 class TestTagImage(TestCase):
     """Tests for tag_image and untag_image methods."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "PATCH /images/img-123/tag": FakeResponse(body=make_image(uuid="img-123", tag="myapp:v1").model_dump()),
@@ -206,7 +232,7 @@ class TestTagImage(TestCase):
 class TestGetImage(TestCase):
     """Tests for get_image and get_image_by_tag methods."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/img-123/": FakeResponse(body=make_image(uuid="img-123", tag="test:latest").model_dump()),
@@ -231,7 +257,7 @@ class TestGetImage(TestCase):
 class TestListDirectory(TestCase):
     """Tests for list_directory method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/img-123/list": FakeResponse(
@@ -271,7 +297,7 @@ class TestListDirectory(TestCase):
 class TestReadFile(TestCase):
     """Tests for read_file method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/img-123/download": FakeResponse(body="file content here"),
@@ -289,7 +315,7 @@ class TestReadFile(TestCase):
 class TestFileExists(TestCase):
     """Tests for file_exists method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /inspect/img-123/download": FakeResponse(http_status=HTTPStatus.OK),
@@ -306,7 +332,7 @@ class TestFileExists(TestCase):
 class TestFileExistsFalse(TestCase):
     """Tests for file_exists returns False."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /inspect/img-123/download": FakeResponse(http_status=HTTPStatus.NOT_FOUND),
@@ -323,7 +349,7 @@ class TestFileExistsFalse(TestCase):
 class TestUploadFile(TestCase):
     """Tests for upload_file method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body={"uuid": "file-123", "sha256": "abc123"}),
@@ -350,7 +376,7 @@ class TestUploadFile(TestCase):
 class TestListOperations(TestCase):
     """Tests for list_operations method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations": FakeResponse(
@@ -381,7 +407,7 @@ class TestListOperations(TestCase):
 class TestListOperationsWithFilters(TestCase):
     """Tests for list_operations with filters."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations": FakeResponse(body={"operations": []}),
@@ -402,7 +428,7 @@ class TestListOperationsWithFilters(TestCase):
 class TestListOperationsListFormat(TestCase):
     """Tests for list_operations with list response format."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         # Using dict wrapper with "operations" key to match client expectation
         return {
@@ -432,7 +458,7 @@ class TestListOperationsListFormat(TestCase):
 class TestGetOperation(TestCase):
     """Tests for get_operation method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -470,7 +496,7 @@ class TestGetOperation(TestCase):
 class TestGetOperationImageImport(TestCase):
     """Tests for get_operation with image import."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-456": FakeResponse(
@@ -501,7 +527,7 @@ class TestGetOperationImageImport(TestCase):
 class TestGetOperationParseError(TestCase):
     """Tests for get_operation parse error."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(body={"invalid": "data"}),
@@ -510,8 +536,6 @@ class TestGetOperationParseError(TestCase):
     @pytest.mark.asyncio
     async def test_get_operation_parse_error(self, contree_client: ContreeClient):
         """Test get_operation with malformed response raises ContreeError."""
-        from contree_mcp.client import ContreeError
-
         with pytest.raises(ContreeError, match="invalid JSON"):
             await contree_client.get_operation("op-123")
 
@@ -519,7 +543,7 @@ class TestGetOperationParseError(TestCase):
 class TestGetOperationImageImportMetadata(TestCase):
     """Tests for get_operation with image import metadata."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -549,7 +573,7 @@ class TestGetOperationImageImportMetadata(TestCase):
 class TestGetOperationInstanceNoResult(TestCase):
     """Tests for get_operation for instance with no result in metadata."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -574,7 +598,7 @@ class TestGetOperationInstanceNoResult(TestCase):
 class TestCancelOperation(TestCase):
     """Tests for cancel_operation method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -599,7 +623,7 @@ class TestCancelOperation(TestCase):
 class TestCancelOperationOtherError(TestCase):
     """Tests for cancel_operation with other error."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -625,7 +649,7 @@ class TestCancelOperationOtherError(TestCase):
 class TestWaitForOperation(TestCase):
     """Tests for wait_for_operation method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-123": FakeResponse(
@@ -659,7 +683,7 @@ class TestWaitForOperation(TestCase):
 class TestRunCommand(TestCase):
     """Tests for run_command method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /instances": FakeResponse(
@@ -691,7 +715,7 @@ class TestRunCommand(TestCase):
 class TestSpawnInstance(TestCase):
     """Tests for spawn_instance method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /instances": FakeResponse(
@@ -745,7 +769,7 @@ class TestSpawnInstance(TestCase):
 class TestSpawnInstanceNoLocation(TestCase):
     """Tests for spawn_instance when no Location header."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /instances": FakeResponse(http_status=HTTPStatus.ACCEPTED, body={"uuid": ""}),
@@ -763,14 +787,13 @@ class TestSpawnInstanceNoLocation(TestCase):
 class TestContextManager(TestCase):
     """Tests for async context manager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {}
 
-    @pytest.mark.asyncio
-    async def test_context_manager(self, fake_server_url: str, tmp_cache: Cache) -> None:
+    async def test_context_manager(self, tmp_cache: Cache) -> None:
         """Test client works as async context manager."""
-        async with ContreeClient(base_url=fake_server_url, token="test-token", cache=tmp_cache) as client:
+        async with ContreeClient(base_url=FAKE_SERVER_URL, token="test-token", cache=tmp_cache) as client:
             assert client is not None
 
         # After exiting, session should be cleaned up (removed from __dict__)
@@ -780,7 +803,7 @@ class TestContextManager(TestCase):
 class TestCancelIncompleteOperations(TestCase):
     """Tests for cancel_incomplete_operations method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-1": FakeResponse(
@@ -809,7 +832,7 @@ class TestCancelIncompleteOperations(TestCase):
 class TestCancelIncompleteOperationsWithError(TestCase):
     """Tests for cancel_incomplete_operations error handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-1": FakeResponse(http_status=HTTPStatus.NOT_FOUND),
@@ -860,7 +883,7 @@ class TestContreeError:
 class TestCheckFileExistsByHash(TestCase):
     """Tests for check_file_exists_by_hash method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.OK),
@@ -876,7 +899,7 @@ class TestCheckFileExistsByHash(TestCase):
 class TestCheckFileExistsByHashNotFound(TestCase):
     """Tests for check_file_exists_by_hash returns False on 404."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.NOT_FOUND),
@@ -892,7 +915,7 @@ class TestCheckFileExistsByHashNotFound(TestCase):
 class TestCheckFileExistsByHashException(TestCase):
     """Tests for check_file_exists_by_hash returns False on server error."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.INTERNAL_SERVER_ERROR),
@@ -908,7 +931,7 @@ class TestCheckFileExistsByHashException(TestCase):
 class TestCheckFileExists(TestCase):
     """Tests for check_file_exists method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.OK),
@@ -925,7 +948,7 @@ class TestCheckFileExists(TestCase):
 class TestCheckFileExistsFalse(TestCase):
     """Tests for check_file_exists returns False."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.NOT_FOUND),
@@ -942,7 +965,7 @@ class TestCheckFileExistsFalse(TestCase):
 class TestGetFileByHash(TestCase):
     """Tests for get_file_by_hash method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /files": FakeResponse(body={"uuid": "file-123", "sha256": "abc123"}),
@@ -961,7 +984,7 @@ class TestGetFileByHash(TestCase):
 class TestGetFileByHashNotFound(TestCase):
     """Tests for get_file_by_hash when not found."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /files": FakeResponse(http_status=HTTPStatus.NOT_FOUND),
@@ -978,7 +1001,7 @@ class TestGetFileByHashNotFound(TestCase):
 class TestGetFileByHashOtherError(TestCase):
     """Tests for get_file_by_hash with other error."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /files": FakeResponse(http_status=HTTPStatus.INTERNAL_SERVER_ERROR),
@@ -996,7 +1019,7 @@ class TestGetFileByHashOtherError(TestCase):
 class TestResolveImage(TestCase):
     """Tests for resolve_image method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/": FakeResponse(body=make_image(uuid="resolved-uuid", tag="python:3.11").model_dump()),
@@ -1022,7 +1045,7 @@ class TestResolveImage(TestCase):
 class TestImportImageWithTimeout(TestCase):
     """Tests for import_image with timeout parameter."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /images/import": FakeResponse(
@@ -1046,7 +1069,7 @@ class TestImportImageWithTimeout(TestCase):
 class TestListOperationsUntil(TestCase):
     """Tests for list_operations with until parameter."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations": FakeResponse(body={"operations": []}),
@@ -1062,7 +1085,7 @@ class TestListOperationsUntil(TestCase):
 class TestReadFileBinary(TestCase):
     """Tests for read_file method with binary content."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/img-123/download": FakeResponse(body=b"\x00\x01\x02\x03binary"),
@@ -1078,7 +1101,7 @@ class TestReadFileBinary(TestCase):
 class TestFileExistsException(TestCase):
     """Tests for file_exists when an exception occurs."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /inspect/img-123/download": FakeResponse(http_status=HTTPStatus.INTERNAL_SERVER_ERROR),
@@ -1094,7 +1117,7 @@ class TestFileExistsException(TestCase):
 class TestCheckFileExistsException(TestCase):
     """Tests for check_file_exists when an exception occurs."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "HEAD /files": FakeResponse(http_status=HTTPStatus.INTERNAL_SERVER_ERROR),
@@ -1110,7 +1133,7 @@ class TestCheckFileExistsException(TestCase):
 class TestWaitForOperationTimeout(TestCase):
     """Tests for wait_for_operation with timeout."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/op-slow": FakeResponse(
@@ -1134,10 +1157,164 @@ class TestWaitForOperationTimeout(TestCase):
         assert "timed out" in str(exc_info.value).lower()
 
 
+class TestWaitForOperationBackoff:
+    """Tests for the polling backoff of wait_for_operation."""
+
+    async def test_polls_quickly_at_first(self, mock_client: MockClientFactory):
+        """Test a short operation finishes long before a single poll_interval elapses."""
+        statuses = iter(["EXECUTING", "EXECUTING", "EXECUTING", "SUCCESS"])
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            body = {"uuid": "op-poll", "kind": "instance", "status": next(statuses), "metadata": None, "result": None}
+            return httpx.Response(HTTPStatus.OK, json=body)
+
+        async with mock_client(handle_request, poll_interval=10.0) as client:
+            result = await asyncio.wait_for(client.wait_for_operation("op-poll"), timeout=2.0)
+
+        assert result.status == OperationStatus.SUCCESS
+
+    async def test_honors_retry_after(self, mock_client: MockClientFactory):
+        """Test the poll after a Retry-After response waits for the server-given delay, beyond poll_interval."""
+        statuses = iter(["EXECUTING", "EXECUTING", "SUCCESS"])
+        polled_at: list[float] = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            polled_at.append(time.monotonic())
+            body = {"uuid": "op-retry", "kind": "instance", "status": next(statuses), "metadata": None, "result": None}
+            return httpx.Response(HTTPStatus.OK, json=body, headers={"Retry-After": "0.3"})
+
+        async with mock_client(handle_request, poll_interval=0.1) as client:
+            result = await client.wait_for_operation("op-retry", max_wait=5.0)
+
+        assert result.status == OperationStatus.SUCCESS
+        # The first fetch comes from wait_for_operation itself, the tracker polls twice more
+        assert polled_at[2] - polled_at[1] >= 0.3
+
+    async def test_caps_retry_after(self, mock_client: MockClientFactory):
+        """Test a huge Retry-After is honoured only up to RETRY_AFTER_MAX."""
+        statuses = iter(["EXECUTING", "EXECUTING", "SUCCESS"])
+        polled_at: list[float] = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            polled_at.append(time.monotonic())
+            body = {
+                "uuid": "op-cap",
+                "kind": "instance",
+                "status": next(statuses),
+                "metadata": None,
+                "result": None,
+            }
+            return httpx.Response(HTTPStatus.OK, json=body, headers={"Retry-After": "86400"})
+
+        async with mock_client(handle_request, poll_interval=0.1) as client:
+            client.RETRY_AFTER_MAX = 0.3
+            result = await asyncio.wait_for(client.wait_for_operation("op-cap"), timeout=2.0)
+
+        assert result.status == OperationStatus.SUCCESS
+        assert polled_at[2] - polled_at[1] >= 0.3
+
+    @pytest.mark.parametrize("retry_after", ["nan", "inf", "-1"])
+    async def test_ignores_invalid_retry_after(self, mock_client: MockClientFactory, retry_after: str):
+        """Test a non-finite or negative Retry-After leaves the regular backoff in place."""
+        statuses = iter(["EXECUTING", "EXECUTING", "SUCCESS"])
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            body = {
+                "uuid": "op-bad",
+                "kind": "instance",
+                "status": next(statuses),
+                "metadata": None,
+                "result": None,
+            }
+            return httpx.Response(HTTPStatus.OK, json=body, headers={"Retry-After": retry_after})
+
+        async with mock_client(handle_request, poll_interval=0.1) as client:
+            result = await asyncio.wait_for(client.wait_for_operation("op-bad"), timeout=2.0)
+
+        assert result.status == OperationStatus.SUCCESS
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            pytest.param({}, None, id="missing"),
+            pytest.param({"Retry-After": "2"}, 2.0, id="seconds"),
+            pytest.param({"Retry-After": "0.5"}, 0.5, id="fractional"),
+            pytest.param({"Retry-After": "-1"}, None, id="negative"),
+            pytest.param({"Retry-After": "nan"}, None, id="nan"),
+            pytest.param({"Retry-After": "inf"}, None, id="inf"),
+            pytest.param({"Retry-After": "1e400"}, None, id="overflow"),
+            pytest.param({"Retry-After": "86400"}, 86400.0, id="large"),
+            pytest.param({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0, id="past-date"),
+            pytest.param({"Retry-After": "soon"}, None, id="invalid"),
+        ],
+    )
+    def test_parse_retry_after(self, headers: dict[str, str], expected: float | None):
+        assert parse_retry_after(httpx.Headers(headers)) == expected
+
+    def test_parse_retry_after_future_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        delay = parse_retry_after(httpx.Headers({"Retry-After": format_datetime(retry_at, usegmt=True)}))
+        assert delay is not None
+        assert 58 < delay <= 60
+
+
+class TestFetchOperationDeduplication:
+    """Tests for sharing in-flight operation fetches."""
+
+    async def test_concurrent_fetches_share_one_request(self, mock_client: MockClientFactory):
+        """Test concurrent lookups of an uncached operation send a single request."""
+        paths: list[str] = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            body = {"uuid": "op-shared", "kind": "instance", "status": "SUCCESS", "metadata": None, "result": None}
+            return httpx.Response(HTTPStatus.OK, json=body)
+
+        async with mock_client(handle_request) as client:
+            results = await asyncio.gather(*(client.get_operation("op-shared") for _ in range(3)))
+
+        assert [result.status for result in results] == [OperationStatus.SUCCESS] * 3
+        assert paths == ["/v1/operations/op-shared"]
+
+    async def test_tracked_polls_reuse_unchanged_model(self, mock_client: MockClientFactory):
+        """Test the tracker skips revalidating a body identical to its previous poll."""
+        statuses = iter(["EXECUTING", "EXECUTING", "EXECUTING", "SUCCESS"])
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            body = {"uuid": "op-poll", "kind": "instance", "status": next(statuses), "metadata": None, "result": None}
+            return httpx.Response(HTTPStatus.OK, json=body)
+
+        async with mock_client(handle_request, poll_interval=0.05) as client:
+            with patch.object(StructuredResponse, "parse", wraps=StructuredResponse.parse) as parse:
+                result = await asyncio.wait_for(client.wait_for_operation("op-poll"), timeout=2.0)
+
+            assert result.status == OperationStatus.SUCCESS
+            # The untracked first fetch and the first poll parse, the repeated body does not
+            assert parse.call_count == 3
+            assert client._operation_payloads == {}
+
+    async def test_untracked_fetch_keeps_no_payload(self, mock_client: MockClientFactory):
+        """Test fetching an unfinished operation outside a tracker memoizes nothing."""
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            body = {"uuid": "op-lookup", "kind": "instance", "status": "EXECUTING", "metadata": None, "result": None}
+            return httpx.Response(HTTPStatus.OK, json=body)
+
+        async with mock_client(handle_request) as client:
+            operation = await client.get_operation("op-lookup")
+
+            assert operation.status == OperationStatus.EXECUTING
+            assert client._operation_payloads == {}
+
+
 class TestCloseWithTrackedOperationsCancelError(TestCase):
     """Tests for close() when cancel fails."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /images/import": FakeResponse(
@@ -1,8 +1,14 @@
 """Tests for contree_mcp.context module."""
 
+import asyncio
+import contextvars
+
 import pytest
+from starlette.types import Receive, Scope, Send
 
-from contree_mcp.context import StrictContextVar
+from contree_mcp.client import ContreeClient
+from contree_mcp.context import CLIENT, FILES_CACHE, ContextMiddleware, StrictContextVar
+from contree_mcp.file_cache import FileCache
 
 
 class TestStrictContextVar:
@@ -35,3 +41,37 @@ class TestStrictContextVar:
         result = var.get()
 
         assert result == 2
+
+
+class TestContextMiddleware:
+    """Tests for ContextMiddleware."""
+
+    async def test_restores_context_for_each_request(
+        self, contree_client: ContreeClient, files_cache: FileCache
+    ) -> None:
+        """Test that the wrapped app sees the captured client and cache in a fresh context."""
+        seen: list[tuple[ContreeClient, FileCache]] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            seen.append((CLIENT.get(), FILES_CACHE.get()))
+
+        middleware = ContextMiddleware(app, ctx=contextvars.copy_context())
+
+        async def handle_request() -> None:
+            await middleware({"type": "http"}, None, None)
+
+        # An empty context, as uvicorn runs each request without the server's variables
+        await contextvars.Context().run(asyncio.create_task, handle_request())
+
+        assert seen == [(contree_client, files_cache)]
+
+    async def test_reraises_app_errors(self, contree_client: ContreeClient) -> None:
+        """Test that errors from the wrapped app propagate."""
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            raise RuntimeError("boom")
+
+        middleware = ContextMiddleware(app, ctx=contextvars.copy_context())
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await middleware({"type": "http"}, None, None)
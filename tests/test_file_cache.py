@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
 import time
+from datetime import datetime, timezone
 from http import HTTPStatus
 from pathlib import Path
 
+import aiosqlite
 import pytest
 
 from contree_mcp.backend_types import FileResponse
 from contree_mcp.client import ContreeClient
 from contree_mcp.file_cache import DirectoryState, FileCache, FileState
 
-from .conftest import FakeResponse, FakeResponses
+from .conftest import FakeResponse, FakeResponses, cache_db_path
 
 
 @pytest.fixture
-async def file_cache(tmp_path: Path) -> FileCache:
+async def file_cache(request: pytest.FixtureRequest, tmp_path: Path) -> FileCache:
     """Create a FileCache instance with real SQLite db for testing."""
-    db_path = tmp_path / "test_file_cache.db"
-    async with FileCache(db_path=db_path) as cache:
+    async with FileCache(db_path=cache_db_path(request, tmp_path, "test_file_cache.db")) as cache:
         yield cache
 
 
@@ -369,8 +372,6 @@ class TestFileCache:
     @pytest.mark.asyncio
     async def test_retain_keeps_recent_records(self, tmp_path: Path) -> None:
         """Test that retain keeps recent records."""
-        from datetime import datetime, timezone
-
         db_path = tmp_path / "test_file_cache.db"
         async with FileCache(db_path=db_path, retention_days=30) as cache:
             # Insert recent data
@@ -466,11 +467,49 @@ class TestFileCache:
             row = await cursor.fetchone()
             assert row is not None
 
+    @pytest.mark.asyncio
+    async def test_directory_state_file_fk_deferred(self, file_cache: FileCache) -> None:
+        """Test that FK checks on directory_state_file are deferred to commit."""
+        async with file_cache._transaction() as conn:
+            # Child row first, parent row later in the same transaction
+            await conn.execute(
+                "INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)",
+                (42, "file-uuid", "/app/a.txt", 0o644),
+            )
+            await conn.execute(
+                "INSERT INTO directory_state (id, uuid, name, destination) VALUES (?, ?, ?, ?)",
+                (42, "state-uuid", None, "/app"),
+            )
+
+        files = await file_cache.get_directory_state_files(42)
+        assert [f.target_path for f in files] == ["/app/a.txt"]
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self, file_cache: FileCache) -> None:
+        """Test that a failing transaction leaves no partial rows behind."""
+        with pytest.raises(sqlite3.IntegrityError):
+            async with file_cache._transaction() as conn:
+                await conn.execute(
+                    "INSERT INTO directory_state_file (state_id, uuid, target_path, target_mode) VALUES (?, ?, ?, ?)",
+                    (404, "file-uuid", "/app/a.txt", 0o644),
+                )
+
+        assert await file_cache.get_directory_state_files(404) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.cache_backend("disk")
+    async def test_open_enables_wal(self, file_cache: FileCache) -> None:
+        """Test that an on-disk cache is switched to write-ahead logging."""
+        async with file_cache.conn.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+        assert row is not None
+        assert row[0] == "wal"
+
 
 class TestSyncDirectory:
     """Tests for sync_directory method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body=FileResponse(uuid="file-uuid-1", sha256="sha256hash")),
@@ -676,9 +715,9 @@ class TestSyncDirectory:
 
 
 class TestRevalidation:
-    """Tests for file revalidation after 24h."""
+    """Tests for file revalidation of dirty or expired directory states."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body=FileResponse(uuid="file-uuid-1", sha256="sha256hash")),
@@ -770,10 +809,10 @@ class TestRevalidation:
         assert len(files) == 3
 
     @pytest.mark.asyncio
-    async def test_no_revalidation_within_24h(
+    async def test_no_revalidation_when_clean(
         self, contree_client: ContreeClient, file_cache: FileCache, tmp_path: Path
     ) -> None:
-        """Test that revalidation is not triggered within 24h."""
+        """Test that revalidation is not triggered for a clean, recent state."""
         sync_dir = tmp_path / "sync_test"
         sync_dir.mkdir()
         (sync_dir / "file1.txt").write_text("content1")
@@ -788,8 +827,6 @@ class TestRevalidation:
     @pytest.mark.asyncio
     async def test_needs_revalidation_migrated_db(self, tmp_path: Path) -> None:
         """Test that migrated DB rows (NULL updated_at) trigger revalidation."""
-        import aiosqlite
-
         db_path = tmp_path / "migrated.db"
         # Create a DB with the OLD schema (no updated_at column)
         async with aiosqlite.connect(str(db_path)) as conn:
@@ -829,6 +866,103 @@ class TestRevalidation:
             needs = await cache._needs_revalidation(row["id"])
             assert needs is True
 
+            # Migrated rows are marked dirty for a single revalidation sweep
+            async with cache.conn.execute("SELECT dirty FROM directory_state WHERE id = ?", (row["id"],)) as cursor:
+                dirty_row = await cursor.fetchone()
+                assert dirty_row is not None
+                assert dirty_row["dirty"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mark_dirty_for_file_uuid_triggers_revalidation(
+        self, contree_client: ContreeClient, file_cache: FileCache, tmp_path: Path
+    ) -> None:
+        """Test that marking a file dirty forces revalidation of states referencing it."""
+        sync_dir = tmp_path / "sync_test"
+        sync_dir.mkdir()
+        (sync_dir / "file1.txt").write_text("content1")
+
+        state_id = await file_cache.sync_directory(contree_client, sync_dir, destination="/app")
+        assert await file_cache._needs_revalidation(state_id) is False
+
+        marked = await file_cache.mark_dirty_for_file_uuid("file-uuid-1")
+        assert marked == 1
+        assert await file_cache._needs_revalidation(state_id) is True
+
+        # Sync revalidates and clears the dirty flag
+        await file_cache.sync_directory(contree_client, sync_dir, destination="/app")
+        assert await file_cache._needs_revalidation(state_id) is False
+
+    @pytest.mark.asyncio
+    async def test_revalidation_marks_sibling_states_dirty(
+        self, contree_client: ContreeClient, file_cache: FileCache, tmp_path: Path
+    ) -> None:
+        """Test that stale files found during revalidation mark other states sharing them dirty."""
+        sync_dir = tmp_path / "sync_test"
+        sync_dir.mkdir()
+        (sync_dir / "file1.txt").write_text("content1")
+
+        # Two destinations give two directory states sharing the same file
+        first_id = await file_cache.sync_directory(contree_client, sync_dir, destination="/app")
+        second_id = await file_cache.sync_directory(contree_client, sync_dir, destination="/srv")
+        assert await file_cache._needs_revalidation(second_id) is False
+
+        # Age only the first state, its revalidation finds the shared file missing
+        await file_cache.conn.execute(
+            "UPDATE directory_state SET updated_at = datetime('now', '-25 hours') WHERE id = ?",
+            (first_id,),
+        )
+        await file_cache.conn.commit()
+        await file_cache.sync_directory(contree_client, sync_dir, destination="/app")
+
+        assert await file_cache._needs_revalidation(first_id) is False
+        assert await file_cache._needs_revalidation(second_id) is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_syncs(
+        self, contree_client: ContreeClient, file_cache: FileCache, tmp_path: Path
+    ) -> None:
+        """Test that overlapping syncs, including revalidation and new states, do not interleave writes."""
+        sync_dir = tmp_path / "sync_test"
+        sync_dir.mkdir()
+        (sync_dir / "file1.txt").write_text("content1")
+        destinations = [f"/app{i}" for i in range(4)]
+
+        # Half of the destinations already have aged states and get revalidated, the rest are new
+        for destination in destinations[:2]:
+            await file_cache.sync_directory(contree_client, sync_dir, destination=destination)
+        await file_cache.conn.execute("UPDATE directory_state SET updated_at = datetime('now', '-25 hours')")
+        await file_cache.conn.commit()
+
+        state_ids = await asyncio.gather(
+            *(file_cache.sync_directory(contree_client, sync_dir, destination=d) for d in destinations)
+        )
+
+        assert len(set(state_ids)) == len(destinations)
+        for state_id in state_ids:
+            assert len(await file_cache.get_directory_state_files(state_id)) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_syncs_share_state(
+        self, contree_client: ContreeClient, file_cache: FileCache, tmp_path: Path
+    ) -> None:
+        """Test that concurrent first syncs of one directory converge on a single state."""
+        sync_dir = tmp_path / "sync_test"
+        sync_dir.mkdir()
+        (sync_dir / "file1.txt").write_text("content1")
+
+        state_ids = await asyncio.gather(
+            *(file_cache.sync_directory(contree_client, sync_dir, destination="/app") for _ in range(3))
+        )
+
+        assert len(set(state_ids)) == 1
+        assert len(await file_cache.get_directory_state_files(state_ids[0])) == 1
+
+    @pytest.mark.asyncio
+    async def test_mark_dirty_for_unknown_file_uuid(self, file_cache: FileCache) -> None:
+        """Test that marking an unreferenced file dirty is a no-op."""
+        marked = await file_cache.mark_dirty_for_file_uuid("unknown-uuid")
+        assert marked == 0
+
     @pytest.mark.asyncio
     async def test_needs_revalidation_recent(self, file_cache: FileCache) -> None:
         """Test that recent updated_at does not trigger revalidation."""
@@ -873,7 +1007,7 @@ class TestRevalidation:
 class TestRevalidationNoStaleFiles:
     """Tests for revalidation when server still has all files."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body=FileResponse(uuid="file-uuid-1", sha256="sha256hash")),
@@ -1,17 +1,20 @@
 """Tests for GeneralCache."""
 
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 import pytest
 
 from contree_mcp.cache import Cache
 
+from .conftest import cache_db_path
+
 
 @pytest.fixture
-async def cache(tmp_path: Path) -> Cache:
+async def cache(request: pytest.FixtureRequest, tmp_path: Path) -> Cache:
     """Create a Cache instance with real SQLite db for testing."""
-    db_path = tmp_path / "test_cache.db"
-    async with Cache(db_path=db_path) as cache:
+    async with Cache(db_path=cache_db_path(request, tmp_path, "test_cache.db")) as cache:
         yield cache
 
 
@@ -94,6 +97,14 @@ async def test_retain_deletes_old_records(tmp_path: Path) -> None:
 class TestGeneralCache:
     """Tests for GeneralCache core operations."""
 
+    @pytest.mark.asyncio
+    @pytest.mark.cache_backend("disk")
+    async def test_open_enables_wal(self, cache: Cache) -> None:
+        """Test that an on-disk cache is switched to write-ahead logging."""
+        # The journal mode persists in the file; the cache connection maps rows to entries
+        with closing(sqlite3.connect(cache.db_path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
     @pytest.mark.asyncio
     async def test_put_and_get(self, cache: Cache) -> None:
         """Test storing and retrieving an entry."""
@@ -240,6 +251,17 @@ class TestGeneralCache:
         assert ancestors[1].key == "img-child1"
         assert ancestors[2].key == "img-root"
 
+    @pytest.mark.asyncio
+    async def test_get_ancestors_ordered_by_depth(self, cache: Cache) -> None:
+        """Test ancestors come nearest first even when their ids are not in chain order."""
+        await cache.put("image", "img-leaf", {})
+        root = await cache.put("image", "img-root", {})
+        parent = await cache.put("image", "img-parent", {}, parent_id=root.id)
+        await cache.put("image", "img-leaf", {}, parent_id=parent.id)
+
+        ancestors = await cache.get_ancestors("image", "img-leaf")
+        assert [entry.key for entry in ancestors] == ["img-parent", "img-root"]
+
     @pytest.mark.asyncio
     async def test_get_children(self, cache: Cache) -> None:
         """Test getting children of an entry."""
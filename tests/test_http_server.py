@@ -2,11 +2,13 @@
 
 import asyncio
 import contextlib
+import contextvars
 import json
 import os
 import socket
 import sys
-from collections.abc import AsyncIterator
+import tempfile
+from collections.abc import AsyncIterator, Iterator
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from functools import partial
@@ -15,20 +17,28 @@ from pathlib import Path
 import httpx
 import pytest
 import uvicorn
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from mcp.server import FastMCP
 
 from contree_mcp.app import create_mcp_app
 from contree_mcp.arguments import Parser
 from contree_mcp.backend_types import Image
 from contree_mcp.cache import Cache
 from contree_mcp.client import ContreeClient
-from contree_mcp.context import CLIENT, FILES_CACHE
-from contree_mcp.docs import generate_docs_html
+from contree_mcp.context import CLIENT, FILES_CACHE, ContextMiddleware
 from contree_mcp.file_cache import FileCache
-from contree_mcp.resources.guide import SECTIONS
-from contree_mcp.server import amain, index_page
-from tests.conftest import FakeResponse, FakeResponses
+from contree_mcp.server import amain, index_page, render_docs_html
+from tests.conftest import (
+    FAKE_SERVER_URL,
+    FakeResponse,
+    FakeResponses,
+    RouteMatcher,
+    make_fake_transport,
+    serve_fake_server,
+    start_server,
+)
+
+# Keep this module on one xdist worker (``--dist loadgroup``) so its session-scoped servers start once
+pytestmark = pytest.mark.xdist_group("http_server")
 
 # MCP requires explicit Accept header for JSON responses
 MCP_HEADERS = {
@@ -79,90 +89,176 @@ async def mcp_initialize(client: httpx.AsyncClient, base_url: str) -> tuple[http
 class HTTPServer:
     """Container for HTTP server test resources."""
 
-    port: int
     base_url: str
     contree_client: ContreeClient
     server_task: asyncio.Task
     server: uvicorn.Server
 
 
-@pytest.fixture
-def mcp_server_socket() -> socket.socket:
-    """Create a bound socket for the MCP server."""
+def bound_socket() -> socket.socket:
+    """Create a socket bound to a free loopback port."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     sock.bind(("127.0.0.1", 0))
     return sock
 
 
-@pytest.fixture
-def test_parser(tmp_path: Path, mcp_server_socket: socket.socket) -> Parser:
+def cache_args(tmp_path: Path) -> list[str]:
+    """CLI arguments placing both cache databases under ``tmp_path``."""
+    return [f"--cache-files={tmp_path / 'files.db'}", f"--cache-general={tmp_path / 'cache.db'}"]
+
+
+def make_parser(tmp_path: Path, *args: str, url: str = "http://localhost:8080") -> Parser:
+    """Parse the arguments every server test shares plus ``args``, with caches under ``tmp_path``."""
+    return Parser().parse_args([f"--url={url}", "--token=test-token", *cache_args(tmp_path), *args])
+
+
+# Unix domain sockets skip the loopback TCP stack for the servers under test
+UNIX_SOCKETS = hasattr(socket, "AF_UNIX") and sys.platform != "win32"
+
+
+@dataclass
+class ServerSocket:
+    """Listening socket for a server under test and how to reach it."""
+
+    sock: socket.socket
+    base_url: str
+    uds: str | None = None
+
+    def client(self) -> httpx.AsyncClient:
+        # One host and sequential traffic: a small pool whose connections outlive pauses between tests
+        limits = httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=30.0)
+        return httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=self.uds, limits=limits, retries=0))
+
+
+@contextlib.contextmanager
+def server_socket() -> Iterator[ServerSocket]:
+    """Listen on a Unix domain socket where available, on a loopback TCP port otherwise.
+
+    The socket listens before the server starts, so early requests queue in the backlog.
+    """
+    if UNIX_SOCKETS:
+        # Not under tmp_path: its paths overflow the 104-byte sun_path limit on macOS
+        with tempfile.TemporaryDirectory(prefix="mcp-", dir="/tmp") as directory:
+            path = os.path.join(directory, "mcp.sock")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(path)
+            sock.listen()
+            # The port is never dialled, but the MCP DNS rebinding check wants a "localhost:<port>" Host header
+            yield ServerSocket(sock=sock, base_url="http://localhost:8000", uds=path)
+        return
+
+    sock = bound_socket()
+    sock.listen()
+    _, port = sock.getsockname()
+    yield ServerSocket(sock=sock, base_url=f"http://127.0.0.1:{port}")
+
+
+# The fake upstream and the MCP server under test are started once per session.
+# Each test installs its own ``fake_responses`` into the shared route matcher.
+# The in-process server reaches the fake upstream through an httpx.MockTransport; only the
+# amain tests, which build their client from ``--url``, need it listening on a socket.
+
+
+@pytest.fixture(scope="session")
+def fake_server_socket() -> socket.socket:
+    """Create a bound socket for the session-wide fake server."""
+    return bound_socket()
+
+
+@pytest.fixture(scope="session")
+def fake_server_url(fake_server_socket: socket.socket) -> str:
+    """URL for the session-wide fake server."""
+    _, port = fake_server_socket.getsockname()
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture(scope="session")
+def fake_route_matcher() -> RouteMatcher:
+    """Route matcher shared by the session-wide fake server."""
+    return RouteMatcher({})
+
+
+@pytest.fixture(scope="session")
+async def http_fake_server(fake_route_matcher: RouteMatcher, fake_server_socket: socket.socket) -> AsyncIterator[None]:
+    """Session-wide fake server answering from the current test's fake responses."""
+    async with serve_fake_server(fake_route_matcher, fake_server_socket):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _install_fake_responses(fake_responses: FakeResponses, fake_route_matcher: RouteMatcher) -> None:
+    """Point the shared fake server at the current test's fake responses."""
+    fake_route_matcher.reset(fake_responses)
+
+
+@pytest.fixture(scope="session")
+def mcp_server_socket() -> Iterator[ServerSocket]:
+    """Create a listening socket for the MCP server."""
+    with server_socket() as sock:
+        yield sock
+
+
+@pytest.fixture(scope="session")
+def test_parser(tmp_path_factory: pytest.TempPathFactory) -> Parser:
     """Create Parser with real paths for testing."""
-    _, port = mcp_server_socket.getsockname()
-    return Parser().parse_args(
-        [
-            "--token=test-token",
-            "--url=http://localhost:8080",
-            "--mode=http",
-            f"--http-port={port}",
-            f"--cache-files={tmp_path / 'files.db'}",
-            f"--cache-general={tmp_path / 'cache.db'}",
-        ]
-    )
+    tmp_path = tmp_path_factory.mktemp("http_server")
+    return make_parser(tmp_path, "--mode=http")
+
 
+@pytest.fixture(scope="session")
+async def http_client(mcp_server_socket: ServerSocket) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for the MCP server shared by all tests, so connections are pooled and kept alive."""
+    async with mcp_server_socket.client() as client:
+        yield client
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+async def mcp_app_bundle(test_parser: Parser) -> tuple[FastMCP, str]:
+    """MCP app and its rendered docs page, built once since both only depend on registered tools."""
+    mcp = create_mcp_app()
+    return mcp, await render_docs_html(mcp, test_parser.http.port)
+
+
+@pytest.fixture(scope="session")
 async def http_server(
-    test_parser: Parser,
-    mcp_server_socket: socket.socket,
-    http_fake_server: None,
-    fake_server_url: str,
+    mcp_app_bundle: tuple[FastMCP, str],
+    mcp_server_socket: ServerSocket,
+    fake_route_matcher: RouteMatcher,
 ) -> AsyncIterator[HTTPServer]:
     """Start HTTP server with real ContreeClient and real caches for testing."""
-    _, port = mcp_server_socket.getsockname()
-
     async with AsyncExitStack() as stack:
-        # Create real caches and client pointing to fake server
-        files_cache = await stack.enter_async_context(FileCache(db_path=test_parser.cache.files.expanduser()))
-        general_cache = await stack.enter_async_context(Cache(db_path=test_parser.cache.general.expanduser()))
+        # Real caches on in-memory SQLite, nothing here checks persistence; the amain test covers disk
+        files_cache = await stack.enter_async_context(FileCache(db_path=Path(":memory:")))
+        general_cache = await stack.enter_async_context(Cache(db_path=Path(":memory:")))
+        # The upstream is answered in-process by the fake transport, only the MCP server itself listens
         client = await stack.enter_async_context(
-            ContreeClient(base_url=fake_server_url, token="test-token", cache=general_cache)
+            ContreeClient(
+                base_url=FAKE_SERVER_URL,
+                token="test-token",
+                cache=general_cache,
+                transport=make_fake_transport(fake_route_matcher),
+            )
         )
 
-        # Middleware to set context variables for each request
-        class ContextMiddleware(BaseHTTPMiddleware):
-            async def dispatch(self, request: Request, call_next):
-                CLIENT.set(client)
-                FILES_CACHE.set(files_cache)
-                return await call_next(request)
-
-        # Create MCP app
-        mcp = create_mcp_app()
-
-        # Generate docs HTML
-        tools = await mcp.list_tools()
-        templates = await mcp.list_resource_templates()
-        docs_html = generate_docs_html(
-            server_instructions=mcp.instructions or "",
-            tools=tools,
-            templates=templates,
-            guides=SECTIONS,
-            http_port=test_parser.http.port,
-        )
+        # Context for the server only, so the session fixture does not leak CLIENT into other tests
+        ctx = contextvars.copy_context()
+        ctx.run(CLIENT.set, client)
+        ctx.run(FILES_CACHE.set, files_cache)
 
+        mcp, docs_html = mcp_app_bundle
         app = mcp.streamable_http_app()
-        app.add_middleware(ContextMiddleware)
+        app.add_middleware(ContextMiddleware, ctx=ctx)
         app.add_route("/", partial(index_page, docs_html), methods=["GET"])
 
-        config = uvicorn.Config(app, log_level="error")
+        config = uvicorn.Config(app, log_level="error", http="httptools")
         server = uvicorn.Server(config)
 
         # Start server with pre-bound socket
-        server_task = asyncio.create_task(server.serve(sockets=[mcp_server_socket]))
+        server_task = await start_server(server, mcp_server_socket.sock)
 
         yield HTTPServer(
-            port=port,
-            base_url=f"http://127.0.0.1:{port}",
+            base_url=mcp_server_socket.base_url,
             contree_client=client,
             server_task=server_task,
             server=server,
@@ -173,10 +269,17 @@ async def http_server(
         await server_task
 
 
+@pytest.fixture(scope="session")
+async def mcp_session(http_client: httpx.AsyncClient, http_server: HTTPServer) -> str | None:
+    """MCP session initialized once and shared by all requests that need one."""
+    _, session_id = await mcp_initialize(http_client, http_server.base_url)
+    return session_id
+
+
 class TestHTTPServerIntegration:
     """Integration tests for the HTTP server."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         """Fake responses for HTTP server integration tests."""
         return {
@@ -194,251 +297,175 @@ class TestHTTPServerIntegration:
         }
 
     @pytest.mark.asyncio
-    async def test_docs_page_returns_html(self, http_server: HTTPServer) -> None:
+    async def test_docs_page_returns_html(self, http_client: httpx.AsyncClient, http_server: HTTPServer) -> None:
         """Test that GET / returns the docs HTML page."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{http_server.base_url}/")
+        response = await http_client.get(f"{http_server.base_url}/")
 
-            assert response.status_code == 200
-            assert "text/html" in response.headers["content-type"]
-            assert "Contree MCP Server" in response.text
-            assert "list_images" in response.text
-            assert "run" in response.text
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+        assert "Contree MCP Server" in response.text
+        assert "list_images" in response.text
+        assert "run" in response.text
 
     @pytest.mark.asyncio
-    async def test_mcp_initialize(self, http_server: HTTPServer) -> None:
+    async def test_mcp_initialize(self, http_client: httpx.AsyncClient, http_server: HTTPServer) -> None:
         """Test MCP initialize request."""
-        async with httpx.AsyncClient() as client:
-            response, _ = await mcp_initialize(client, http_server.base_url)
-
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "serverInfo" in result["result"]
-            assert result["result"]["serverInfo"]["name"] == "contree-mcp"
-
-    @pytest.mark.asyncio
-    async def test_mcp_list_tools(self, http_server: HTTPServer) -> None:
-        """Test MCP tools/list request."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            response, _ = await mcp_request(client, http_server.base_url, "tools/list", {}, 2, session_id)
+        response, _ = await mcp_initialize(http_client, http_server.base_url)
 
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "tools" in result["result"]
-
-            tool_names = [t["name"] for t in result["result"]["tools"]]
-            assert "list_images" in tool_names
-            assert "run" in tool_names
-            assert "import_image" in tool_names
+        assert response.status_code == 200
+        result = response.json()
+        assert "result" in result
+        assert "serverInfo" in result["result"]
+        assert result["result"]["serverInfo"]["name"] == "contree-mcp"
 
+    @pytest.mark.parametrize(
+        ("method", "result_key", "field", "expected"),
+        [
+            pytest.param("tools/list", "tools", "name", {"list_images", "run", "import_image"}, id="tools"),
+            # Prompts from create_mcp_app are registered
+            pytest.param("prompts/list", "prompts", "name", {"run-python", "run-shell", "sync-and-run"}, id="prompts"),
+            # Guide sections are static resources
+            pytest.param(
+                "resources/list",
+                "resources",
+                "uri",
+                {"contree://guide/workflow", "contree://guide/quickstart"},
+                id="resources",
+            ),
+            # Image and operations resources are templates
+            pytest.param(
+                "resources/templates/list",
+                "resourceTemplates",
+                "uriTemplate",
+                {"contree://image/{image}/lineage", "contree://operations/instance/{operation_id}"},
+                id="resource-templates",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_mcp_call_list_images(self, http_server: HTTPServer) -> None:
-        """Test calling list_images tool via MCP."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            response, _ = await mcp_request(
-                client,
-                http_server.base_url,
-                "tools/call",
-                {"name": "list_images", "arguments": {}},
-                2,
-                session_id,
-            )
+    async def test_mcp_list(
+        self,
+        http_client: httpx.AsyncClient,
+        http_server: HTTPServer,
+        mcp_session: str | None,
+        method: str,
+        result_key: str,
+        field: str,
+        expected: set[str],
+    ) -> None:
+        """Test MCP */list requests return the registered items."""
+        response, _ = await mcp_request(http_client, http_server.base_url, method, {}, 2, mcp_session)
 
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "content" in result["result"]
+        assert response.status_code == 200
+        result = response.json()
+        assert "result" in result
+        assert result_key in result["result"]
 
-            # Verify content contains expected images from fake_responses
-            content = result["result"]["content"]
-            assert len(content) > 0
-            text_content = content[0]["text"]
-            assert "img-1" in text_content
-            assert "python:3.11" in text_content
+        names = {item[field] for item in result["result"][result_key]}
+        assert expected <= names
 
+    @pytest.mark.parametrize(
+        ("name", "arguments", "expected"),
+        [
+            # Content contains expected images from fake_responses
+            pytest.param("list_images", {}, ["img-1", "python:3.11"], id="list_images"),
+            pytest.param("get_image", {"image": "img-1"}, ["img-1"], id="get_image"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_mcp_call_get_image(self, http_server: HTTPServer) -> None:
-        """Test calling get_image tool via MCP."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            response, _ = await mcp_request(
-                client,
-                http_server.base_url,
-                "tools/call",
-                {"name": "get_image", "arguments": {"image": "img-1"}},
-                2,
-                session_id,
-            )
+    async def test_mcp_call_tool(
+        self,
+        http_client: httpx.AsyncClient,
+        http_server: HTTPServer,
+        mcp_session: str | None,
+        name: str,
+        arguments: dict,
+        expected: list[str],
+    ) -> None:
+        """Test calling tools via MCP."""
+        response, _ = await mcp_request(
+            http_client,
+            http_server.base_url,
+            "tools/call",
+            {"name": name, "arguments": arguments},
+            2,
+            mcp_session,
+        )
 
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
+        assert response.status_code == 200
+        result = response.json()
+        assert "result" in result
+        assert "content" in result["result"]
 
-            # Verify content contains expected image data
-            content = result["result"]["content"]
-            assert len(content) > 0
-            text_content = content[0]["text"]
-            assert "img-1" in text_content
+        content = result["result"]["content"]
+        assert len(content) > 0
+        text_content = content[0]["text"]
+        for value in expected:
+            assert value in text_content
 
     @pytest.mark.asyncio
-    async def test_mcp_read_resource(self, http_server: HTTPServer) -> None:
+    async def test_mcp_read_resource(
+        self, http_client: httpx.AsyncClient, http_server: HTTPServer, mcp_session: str | None
+    ) -> None:
         """Test reading a resource via MCP."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            response, _ = await mcp_request(
-                client,
-                http_server.base_url,
-                "resources/read",
-                {"uri": "contree://guide/quickstart"},
-                2,
-                session_id,
-            )
+        response, _ = await mcp_request(
+            http_client,
+            http_server.base_url,
+            "resources/read",
+            {"uri": "contree://guide/quickstart"},
+            2,
+            mcp_session,
+        )
 
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "contents" in result["result"]
-            # Verify guide content is returned
-            contents = result["result"]["contents"]
-            assert len(contents) > 0
+        assert response.status_code == 200
+        result = response.json()
+        assert "result" in result
+        assert "contents" in result["result"]
+        # Verify guide content is returned
+        contents = result["result"]["contents"]
+        assert len(contents) > 0
 
     @pytest.mark.asyncio
-    async def test_404_for_unknown_route(self, http_server: HTTPServer) -> None:
+    async def test_404_for_unknown_route(self, http_client: httpx.AsyncClient, http_server: HTTPServer) -> None:
         """Test that unknown routes return 404."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{http_server.base_url}/unknown")
-            assert response.status_code == 404
-
-    @pytest.mark.asyncio
-    async def test_mcp_list_prompts(self, http_server: HTTPServer) -> None:
-        """Test MCP prompts/list request returns all prompts."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            response, _ = await mcp_request(client, http_server.base_url, "prompts/list", {}, 2, session_id)
-
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "prompts" in result["result"]
-
-            prompt_names = [p["name"] for p in result["result"]["prompts"]]
-            # Verify prompts from create_mcp_app are registered
-            assert "run-python" in prompt_names
-            assert "run-shell" in prompt_names
-            assert "sync-and-run" in prompt_names
-
-    @pytest.mark.asyncio
-    async def test_mcp_list_resources(self, http_server: HTTPServer) -> None:
-        """Test MCP resources/list request returns guide static resources and templates."""
-        async with httpx.AsyncClient() as client:
-            _, session_id = await mcp_initialize(client, http_server.base_url)
-
-            # Check resource templates (for image/operations resources)
-            response, _ = await mcp_request(
-                client,
-                http_server.base_url,
-                "resources/templates/list",
-                {},
-                2,
-                session_id,
-            )
-
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "resourceTemplates" in result["result"]
-
-            templates = result["result"]["resourceTemplates"]
-            assert len(templates) > 0
-            # Should have image and operations resource templates
-            template_uris = [t["uriTemplate"] for t in templates]
-            assert any("contree://image" in uri for uri in template_uris)
-
-            # Check static resources (for guide sections)
-            response, _ = await mcp_request(
-                client,
-                http_server.base_url,
-                "resources/list",
-                {},
-                3,
-                session_id,
-            )
-
-            assert response.status_code == 200
-            result = response.json()
-            assert "result" in result
-            assert "resources" in result["result"]
-
-            resources = result["result"]["resources"]
-            assert len(resources) > 0
-            # Should have guide static resources
-            resource_uris = [r["uri"] for r in resources]
-            assert any("contree://guide/workflow" in uri for uri in resource_uris)
-            assert any("contree://guide/quickstart" in uri for uri in resource_uris)
+        response = await http_client.get(f"{http_server.base_url}/unknown")
+        assert response.status_code == 404
 
 
 class TestAmainHTTPMode:
     """Tests for server.amain in HTTP mode."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         """Fake responses for amain tests."""
         return {
             "GET /images": FakeResponse(body={"images": []}),
         }
 
+    @pytest.fixture
+    def amain_socket(self) -> Iterator[ServerSocket]:
+        """Listening socket handed to amain."""
+        with server_socket() as sock:
+            yield sock
+
     @pytest.mark.asyncio
     async def test_amain_http_mode_starts_server(
         self,
         tmp_path: Path,
         http_fake_server: None,
         fake_server_url: str,
+        amain_socket: ServerSocket,
     ) -> None:
         """Test that amain starts HTTP server and serves requests."""
-        # Find free port
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.bind(("127.0.0.1", 0))
-        _, port = sock.getsockname()
-        sock.close()
-
-        parser = Parser().parse_args(
-            [
-                f"--url={fake_server_url}",
-                "--token=test-token",
-                "--mode=http",
-                f"--http-port={port}",
-                f"--cache-files={tmp_path / 'files.db'}",
-                f"--cache-general={tmp_path / 'cache.db'}",
-            ]
-        )
+        parser = make_parser(tmp_path, "--mode=http", url=fake_server_url)
 
         # Run amain as a task
-        amain_task = asyncio.create_task(amain(parser))
+        amain_task = asyncio.create_task(amain(parser, sock=amain_socket.sock))
 
         try:
-            # Wait for server to start
-            base_url = f"http://127.0.0.1:{port}"
-            async with httpx.AsyncClient() as client:
-                # Retry until server is ready
-                for _ in range(50):
-                    try:
-                        response = await client.get(f"{base_url}/")
-                        if response.status_code == 200:
-                            break
-                    except httpx.ConnectError:
-                        await asyncio.sleep(0.1)
-                else:
-                    pytest.fail("Server didn't start in time")
+            async with amain_socket.client() as http_client:
+                # The request queues in the listen backlog until amain accepts it
+                response = await asyncio.wait_for(http_client.get(f"{amain_socket.base_url}/"), timeout=2.0)
 
                 # Verify docs page is served
                 assert response.status_code == 200
@@ -446,8 +473,8 @@ class TestAmainHTTPMode:
                 assert "Contree MCP Server" in response.text
 
                 # Verify MCP endpoint works
-                init_response = await client.post(
-                    f"{base_url}/mcp",
+                init_response = await http_client.post(
+                    f"{amain_socket.base_url}/mcp",
                     json={
                         "jsonrpc": "2.0",
                         "id": 1,
@@ -471,33 +498,58 @@ class TestAmainHTTPMode:
                 await amain_task
 
 
-class TestAmainSTDIOMode:
-    """Tests for server.amain in STDIO mode via subprocess."""
+@dataclass
+class STDIOServer:
+    """MCP server subprocess in STDIO mode with pipelined JSON-RPC line helpers."""
 
-    @pytest.mark.asyncio
-    async def test_amain_stdio_mode_subprocess(self, tmp_path: Path) -> None:
-        """Test that STDIO mode works via subprocess."""
-        # Create a subprocess running in STDIO mode
-        env = os.environ.copy()
-        env["CONTREE_MCP_TOKEN"] = "test-token"
-        env["CONTREE_MCP_URL"] = "http://localhost:9999"  # Won't actually connect
-
-        proc = await asyncio.create_subprocess_exec(
-            sys.executable,
-            "-m",
-            "contree_mcp",
-            "--mode=stdio",
-            f"--cache-files={tmp_path / 'files.db'}",
-            f"--cache-general={tmp_path / 'cache.db'}",
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
+    proc: asyncio.subprocess.Process
+    responses: dict[int, dict]
+
+    async def send(self, *messages: dict) -> None:
+        """Write all messages before draining, so the server can work on them back to back."""
+        assert self.proc.stdin is not None
+        self.proc.stdin.writelines((json.dumps(message) + "\n").encode() for message in messages)
+        await self.proc.stdin.drain()
+
+    async def recv(self, count: int, timeout: float = 5.0) -> dict[int, dict]:
+        """Read ``count`` responses under a single timeout, keyed by their JSON-RPC id."""
+        assert self.proc.stdout is not None
+        stdout = self.proc.stdout
+
+        async def read() -> dict[int, dict]:
+            responses = [json.loads(await stdout.readline()) for _ in range(count)]
+            return {response["id"]: response for response in responses}
 
         try:
-            # Send initialize request via STDIO
-            init_request = {
+            return await asyncio.wait_for(read(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pytest.fail("STDIO server didn't respond in time")
+
+
+@pytest.fixture(scope="module")
+async def stdio_server(tmp_path_factory: pytest.TempPathFactory) -> AsyncIterator[STDIOServer]:
+    """Start one STDIO server subprocess and pipeline the requests the module's STDIO tests check."""
+    tmp_path = tmp_path_factory.mktemp("stdio")
+    env = os.environ.copy()
+    env["CONTREE_MCP_TOKEN"] = "test-token"
+    env["CONTREE_MCP_URL"] = "http://localhost:9999"  # Won't actually connect
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "contree_mcp",
+        "--mode=stdio",
+        *cache_args(tmp_path),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+
+    try:
+        server = STDIOServer(proc=proc, responses={})
+        await server.send(
+            {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "initialize",
@@ -506,53 +558,42 @@ class TestAmainSTDIOMode:
                     "capabilities": {},
                     "clientInfo": {"name": "test-stdio", "version": "1.0"},
                 },
-            }
-            request_line = json.dumps(init_request) + "\n"
-
-            assert proc.stdin is not None
-            assert proc.stdout is not None
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
+        )
+        # Interpreter startup dominates, both requests are answered as soon as the server is up
+        server.responses = await server.recv(2, timeout=10.0)
+        yield server
+    finally:
+        # Terminate the subprocess
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
 
-            proc.stdin.write(request_line.encode())
-            await proc.stdin.drain()
 
-            # Read response with timeout
-            try:
-                response_line = await asyncio.wait_for(proc.stdout.readline(), timeout=10.0)
-            except asyncio.TimeoutError:
-                pytest.fail("STDIO server didn't respond in time")
+class TestAmainSTDIOMode:
+    """Tests for server.amain in STDIO mode via subprocess."""
 
-            # Parse response
-            response = json.loads(response_line.decode())
-            assert "result" in response
-            assert response["result"]["serverInfo"]["name"] == "contree-mcp"
+    @pytest.mark.asyncio
+    async def test_amain_stdio_mode_subprocess(self, stdio_server: STDIOServer) -> None:
+        """Test that STDIO mode answers initialize via subprocess."""
+        response = stdio_server.responses[1]
+        assert "result" in response
+        assert response["result"]["serverInfo"]["name"] == "contree-mcp"
 
-            # Send tools/list request
-            list_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {},
-            }
-            proc.stdin.write((json.dumps(list_request) + "\n").encode())
-            await proc.stdin.drain()
-
-            response_line = await asyncio.wait_for(proc.stdout.readline(), timeout=5.0)
-            response = json.loads(response_line.decode())
-            assert "result" in response
-            assert "tools" in response["result"]
-
-            tool_names = [t["name"] for t in response["result"]["tools"]]
-            assert "list_images" in tool_names
-            assert "run" in tool_names
+    @pytest.mark.asyncio
+    async def test_amain_stdio_mode_list_tools(self, stdio_server: STDIOServer) -> None:
+        """Test tools/list over STDIO."""
+        response = stdio_server.responses[2]
+        assert "result" in response
+        assert "tools" in response["result"]
 
-        finally:
-            # Terminate the subprocess
-            proc.terminate()
-            try:
-                await asyncio.wait_for(proc.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
+        tool_names = [t["name"] for t in response["result"]["tools"]]
+        assert "list_images" in tool_names
+        assert "run" in tool_names
 
 
 class TestAmainInvalidMode:
@@ -566,20 +607,13 @@ class TestAmainInvalidMode:
         fake_server_url: str,
     ) -> None:
         """Test that invalid mode raises ValueError."""
-        parser = Parser().parse_args(
-            [
-                f"--url={fake_server_url}",
-                "--token=test-token",
-                f"--cache-files={tmp_path / 'files.db'}",
-                f"--cache-general={tmp_path / 'cache.db'}",
-            ]
-        )
+        parser = make_parser(tmp_path, url=fake_server_url)
         # Manually set invalid mode
         parser.mode = "invalid"  # type: ignore[assignment]
 
         with pytest.raises(ValueError, match="Unsupported server mode"):
             await amain(parser)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {}
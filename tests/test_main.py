@@ -1,9 +1,10 @@
 """Tests for contree_mcp.__main__ module."""
 
-import os
-import subprocess
 import sys
 
+import pytest
+
+from contree_mcp.__main__ import main
 from contree_mcp.arguments import Parser, ServerMode
 
 
@@ -61,34 +62,30 @@ class TestParser:
 
 
 class TestCLI:
-    """Integration tests for CLI entry point."""
+    """In-process tests for the CLI entry point."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
         """Test that --help works and exits cleanly."""
-        result = subprocess.run(
-            [sys.executable, "-m", "contree_mcp", "--help"],
-            capture_output=True,
-            text=True,
-        )
+        monkeypatch.setattr(sys, "argv", ["contree-mcp", "--help"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
 
-        assert result.returncode == 0
-        assert "usage:" in result.stdout.lower() or "--help" in result.stdout
+        assert exc_info.value.code == 0
+        stdout = capsys.readouterr().out
+        assert "usage:" in stdout.lower() or "--help" in stdout
 
-    def test_cli_missing_required_token(self) -> None:
+    def test_cli_missing_required_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that missing required --token produces error."""
         # Clear env vars that could provide the token and config file
-        env = os.environ.copy()
-        env.pop("CONTREE_MCP_TOKEN", None)
-        env.pop("CONTREE_TOKEN", None)
+        monkeypatch.delenv("CONTREE_MCP_TOKEN", raising=False)
+        monkeypatch.delenv("CONTREE_TOKEN", raising=False)
         # Point to non-existent config file to ensure no token from config
-        env["CONTREE_MCP_CONFIG"] = "/nonexistent/config.ini"
-
-        result = subprocess.run(
-            [sys.executable, "-m", "contree_mcp"],
-            capture_output=True,
-            text=True,
-            env=env,
-        )
+        monkeypatch.setenv("CONTREE_MCP_CONFIG", "/nonexistent/config.ini")
+        monkeypatch.setattr(sys, "argv", ["contree-mcp"])
 
         # Should fail because --token is required
-        assert result.returncode != 0
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code != 0
@@ -1,6 +1,7 @@
 """Tests for contree_mcp.types module."""
 
 import base64
+from unittest.mock import patch
 
 from contree_mcp.backend_types import (
     ConsumedResources,
@@ -95,6 +96,22 @@ class TestStream:
         stream = Stream(value=encoded, encoding="base64")
         assert stream.text() == "hello binary"
 
+    def test_base64_text_cached(self) -> None:
+        """Test that the same base64 value is decoded once and equality is unaffected."""
+        encoded = base64.b64encode(b"cached binary").decode()
+        stream = Stream(value=encoded, encoding="base64")
+
+        with patch("contree_mcp.backend_types.b64decode", wraps=base64.b64decode) as b64decode:
+            assert stream.text() == "cached binary"
+            assert stream.text() == "cached binary"
+            assert b64decode.call_count == 1
+
+            stream.value = base64.b64encode(b"changed").decode()
+            assert stream.text() == "changed"
+            assert b64decode.call_count == 2
+
+        assert Stream(value=encoded, encoding="base64") == Stream(value=encoded, encoding="base64")
+
     def test_truncated_flag(self) -> None:
         """Test truncated flag."""
         stream = Stream(value="partial", encoding="ascii", truncated=True)
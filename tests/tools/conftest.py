@@ -0,0 +1,12 @@
+"""Shared fixtures for tool tests."""
+
+import pytest
+
+from contree_mcp.resources.guide import SECTIONS
+
+
+# SECTIONS is fixed for the whole run, so the sorted names are computed once per session
+@pytest.fixture(scope="session")
+def expected_guide_sections() -> tuple[str, ...]:
+    """Guide section names in the order get_guide reports them."""
+    return tuple(sorted(SECTIONS.keys()))
@@ -8,7 +8,7 @@ from . import TestCase
 
 
 class TestCancelOperation(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -24,7 +24,6 @@ class TestCancelOperation(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_cancel_success(self) -> None:
         result = await cancel_operation(operation_id="op-1")
         assert isinstance(result, CancelOperationOutput)
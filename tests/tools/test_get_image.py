@@ -3,37 +3,34 @@ from http import HTTPStatus
 import pytest
 
 from contree_mcp.backend_types import Image
+from contree_mcp.client import ContreeError
 from contree_mcp.tools.get_image import get_image
 from tests.conftest import FakeResponse, FakeResponses
 
 from . import TestCase
 
+# The tag lookup and the UUID lookup return the same image, so it is validated once and shared
+IMAGE = Image(uuid="img-1", tag="python:3.11", created_at="2024-01-01T00:00:00Z")
+
 
 class TestGetImageHappyPath(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "GET /inspect/": FakeResponse(
-                body=Image(uuid="img-1", tag="python:3.11", created_at="2024-01-01T00:00:00Z")
-            ),
-            "GET /inspect/{uuid}/": FakeResponse(
-                body=Image(uuid="img-1", tag="python:3.11", created_at="2024-01-01T00:00:00Z")
-            ),
+            "GET /inspect/": FakeResponse(body=IMAGE),
+            "GET /inspect/{uuid}/": FakeResponse(body=IMAGE),
         }
 
-    @pytest.mark.asyncio
     async def test_get_by_uuid(self) -> None:
         result = await get_image(image="img-1")
         assert result.uuid == "img-1"
         assert result.tag == "python:3.11"
 
-    @pytest.mark.asyncio
     async def test_get_by_tag(self) -> None:
         result = await get_image(image="tag:python:3.11")
         assert result.uuid == "img-1"
         assert result.tag == "python:3.11"
 
-    @pytest.mark.asyncio
     async def test_output_type_correct(self) -> None:
         result = await get_image(image="img-1")
         assert isinstance(result, Image)
@@ -43,7 +40,7 @@ class TestGetImageHappyPath(TestCase):
 
 
 class TestGetImageErrorHandling(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /inspect/{uuid}/": FakeResponse(
@@ -52,7 +49,6 @@ class TestGetImageErrorHandling(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_image_not_found(self) -> None:
-        with pytest.raises(Exception):  # noqa: B017
+        with pytest.raises(ContreeError, match="Image not found"):
             await get_image(image="nonexistent")
@@ -1,137 +1,120 @@
+from typing import Any
+
 import pytest
 
 from contree_mcp.backend_types import (
-    ConsumedResources,
     InstanceMetadata,
-    InstanceResult,
     OperationKind,
     OperationResponse,
-    OperationResult,
     OperationStatus,
-    ProcessExitState,
-    Stream,
 )
 from contree_mcp.tools.get_operation import get_operation
 from tests.conftest import FakeResponse, FakeResponses
 
 from . import TestCase
 
-
-class TestGetOperationFromAPI(TestCase):
-    """Test get_operation fetching from API."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
+# Plain JSON-ready bodies, so no pydantic models are built while setting up the fake responses
+API_OPERATION_BODY = {
+    "uuid": "op-1",
+    "kind": OperationKind.INSTANCE.value,
+    "status": OperationStatus.SUCCESS.value,
+    "error": None,
+    "metadata": {
+        "command": "echo hello",
+        "image": "img-1",
+        "result": {
+            "state": {"exit_code": 0, "pid": 1, "timed_out": False},
+            "stdout": {"value": "hello", "encoding": "ascii"},
+            "stderr": {"value": "", "encoding": "ascii"},
+            "resources": {"elapsed_time": 0.5},
+        },
+    },
+    "result": {"image": "img-result", "tag": None},
+}
+
+INSTANCE_OPERATION_BODY = {
+    "uuid": "op-instance-1",
+    "kind": OperationKind.INSTANCE.value,
+    "status": OperationStatus.SUCCESS.value,
+    "error": None,
+    "metadata": {
+        "command": "echo test",
+        "image": "img-1",
+        "result": {
+            "state": {"exit_code": 0, "pid": 1, "timed_out": False},
+            "stdout": {"value": "test output", "encoding": "ascii"},
+            "stderr": {"value": "", "encoding": "ascii"},
+            "resources": {"elapsed_time": 1.5},
+        },
+    },
+    "result": {"image": "img-result", "tag": None},
+}
+
+IMAGE_IMPORT_OPERATION_BODY = {
+    "uuid": "op-import-1",
+    "kind": OperationKind.IMAGE_IMPORT.value,
+    "status": OperationStatus.SUCCESS.value,
+    "error": None,
+    "metadata": {
+        "registry": {"url": "docker://test"},
+        "tag": "python:3.11",
+        "timeout": 300,
+    },
+    "result": {"image": "img-imported", "tag": "python:3.11"},
+}
+
+
+# Canned operation body and the fields expected on the parsed response, per get_operation scenario
+SCENARIOS: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {
+    "instance_api": (
+        API_OPERATION_BODY,
+        {"kind": OperationKind.INSTANCE, "image": "img-result", "tag": None, "stdout": "hello"},
+    ),
+    "instance": (
+        INSTANCE_OPERATION_BODY,
+        {"kind": OperationKind.INSTANCE, "image": "img-result", "tag": None, "stdout": "test output"},
+    ),
+    "image_import": (
+        IMAGE_IMPORT_OPERATION_BODY,
+        {"kind": OperationKind.IMAGE_IMPORT, "image": "img-imported", "tag": "python:3.11", "stdout": None},
+    ),
+}
+
+
+class TestGetOperation(TestCase):
+    """Test get_operation fetching successful operations from the API."""
+
+    @pytest.fixture(scope="class")
+    def fake_responses(self, request: pytest.FixtureRequest) -> FakeResponses:
+        body, _ = SCENARIOS[request.param]
         return {
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-1",
-                    "kind": OperationKind.INSTANCE.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "error": None,
-                    "metadata": {
-                        "command": "echo hello",
-                        "image": "img-1",
-                        "result": InstanceResult(
-                            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
-                            stdout=Stream(value="hello", encoding="ascii"),
-                            stderr=Stream(value="", encoding="ascii"),
-                            resources=ConsumedResources(elapsed_time=0.5),
-                        ),
-                    },
-                    "result": OperationResult(image="img-result", tag=None),
-                }
-            ),
-        }
-
-    @pytest.mark.asyncio
-    async def test_get_from_api(self) -> None:
-        result = await get_operation(operation_id="op-1")
-        assert isinstance(result, OperationResponse)
-        assert result.kind == OperationKind.INSTANCE
-        assert result.status == OperationStatus.SUCCESS
-        assert isinstance(result.metadata, InstanceMetadata)
-        assert result.metadata.result.state.exit_code == 0
-
-
-class TestGetInstanceOperation(TestCase):
-    """Test get_operation for instance operations."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-instance-1",
-                    "kind": OperationKind.INSTANCE.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "error": None,
-                    "metadata": {
-                        "command": "echo test",
-                        "image": "img-1",
-                        "result": InstanceResult(
-                            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
-                            stdout=Stream(value="test output", encoding="ascii"),
-                            stderr=Stream(value="", encoding="ascii"),
-                            resources=ConsumedResources(elapsed_time=1.5),
-                        ),
-                    },
-                    "result": OperationResult(image="img-result", tag=None),
-                }
-            ),
-        }
-
-    @pytest.mark.asyncio
-    async def test_get_instance_operation(self) -> None:
-        """Test getting instance operation result."""
-        result = await get_operation(operation_id="op-instance-1")
-        assert isinstance(result, OperationResponse)
-        assert result.status == OperationStatus.SUCCESS
-        assert result.kind == OperationKind.INSTANCE
-        assert isinstance(result.metadata, InstanceMetadata)
-        assert result.metadata.result.stdout.value == "test output"
-        assert result.result is not None
-        assert result.result.image == "img-result"
-
-
-class TestGetImageImportOperation(TestCase):
-    """Test get_operation for image import operations."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-import-1",
-                    "kind": OperationKind.IMAGE_IMPORT.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "error": None,
-                    "metadata": {
-                        "registry": {"url": "docker://test"},
-                        "tag": "python:3.11",
-                        "timeout": 300,
-                    },
-                    "result": {"image": "img-imported", "tag": "python:3.11"},
-                }
-            ),
+            "GET /operations/{uuid}": FakeResponse(body=body),
         }
 
-    @pytest.mark.asyncio
-    async def test_get_image_import_operation(self) -> None:
-        """Test getting image import operation result."""
-        result = await get_operation(operation_id="op-import-1")
+    @pytest.mark.parametrize(
+        "fake_responses,operation_id,expected",
+        [pytest.param(name, body["uuid"], expected, id=name) for name, (body, expected) in SCENARIOS.items()],
+        indirect=["fake_responses"],
+    )
+    async def test_get_operation(self, operation_id: str, expected: dict[str, Any]) -> None:
+        """Test getting a successful operation of each kind."""
+        result = await get_operation(operation_id=operation_id)
         assert isinstance(result, OperationResponse)
         assert result.status == OperationStatus.SUCCESS
-        assert result.kind == OperationKind.IMAGE_IMPORT
+        assert result.kind == expected["kind"]
         assert result.result is not None
-        assert result.result.image == "img-imported"
-        assert result.result.tag == "python:3.11"
+        assert result.result.image == expected["image"]
+        assert result.result.tag == expected["tag"]
+        if expected["stdout"] is not None:
+            assert isinstance(result.metadata, InstanceMetadata)
+            assert result.metadata.result.state.exit_code == 0
+            assert result.metadata.result.stdout.value == expected["stdout"]
 
 
 class TestGetFailedOperation(TestCase):
     """Test get_operation for failed operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -146,7 +129,6 @@ class TestGetFailedOperation(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_get_failed_operation(self) -> None:
         """Test getting failed operation."""
         result = await get_operation(operation_id="op-failed")
@@ -7,83 +7,99 @@ from contree_mcp.auth.registry import RegistryAuth
 from contree_mcp.backend_types import (
     OperationKind,
     OperationResponse,
-    OperationResult,
     OperationStatus,
 )
-from contree_mcp.tools.import_image import import_image
+from contree_mcp.tools.import_image import RegistryAuthenticationError, import_image
 from tests.conftest import FakeResponse, FakeResponses
 
 from . import TestCase
 
 
-@pytest.fixture(autouse=True)
-async def setup_registry_auth(general_cache, contree_client):
-    """Set up registry authentication in cache for all import tests."""
-    await general_cache.put(
-        kind="registry_token",
-        key="docker.io",
-        data={
-            "registry": "docker.io",
-            "username": "testuser",
-            "token": "testtoken",
-            "scopes": ["pull"],
-            "created_at": "2025-01-01T00:00:00Z",
-        },
+def accepted_import(operation_id: str) -> FakeResponse:
+    """Response of the import endpoint accepting a new import operation."""
+    return FakeResponse(
+        http_status=HTTPStatus.ACCEPTED,
+        body={"uuid": operation_id},
+        headers=(("Location", f"/v1/operations/{operation_id}"),),
     )
-    with patch.object(RegistryAuth, "validate_token", new=AsyncMock(return_value=True)):
-        yield
-    await general_cache.delete(kind="registry_token", key="docker.io")
 
 
-class TestImportImageWaitFalse(TestCase):
-    """Test import_image with wait=false."""
+# Fake API responses for each import scenario, selected per test through the indirect fake_responses fixture
+SCENARIOS: dict[str, FakeResponses] = {
+    "wait_false": {
+        "POST /images/import": accepted_import("op-import-123"),
+    },
+    "wait_true": {
+        "POST /images/import": accepted_import("op-import-wait-123"),
+        "GET /operations/{uuid}": FakeResponse(
+            body={
+                "uuid": "op-import-wait-123",
+                "kind": OperationKind.IMAGE_IMPORT.value,
+                "status": OperationStatus.SUCCESS.value,
+                "error": None,
+                "metadata": {
+                    "registry": {"url": "docker.io/library/python:3.11-slim"},
+                    "tag": "python:3.11",
+                    "timeout": 300,
+                },
+                "result": {"image": "img-imported-result", "tag": "python:3.11"},
+            }
+        ),
+    },
+    "no_result": {
+        "POST /images/import": accepted_import("op-import-fail-123"),
+        "GET /operations/{uuid}": FakeResponse(
+            body={
+                "uuid": "op-import-fail-123",
+                "kind": OperationKind.IMAGE_IMPORT.value,
+                "status": OperationStatus.FAILED.value,
+                "error": "Image not found",
+                "metadata": None,
+                "result": None,
+            }
+        ),
+    },
+    "anonymous": {
+        "POST /images/import": accepted_import("op-import-anon-123"),
+    },
+}
+
+
+class TestImportImage(TestCase):
+    """Test import_image against the fake API scenarios."""
+
+    @pytest.fixture(scope="class")
+    def fake_responses(self, request: pytest.FixtureRequest) -> FakeResponses:
+        return SCENARIOS[request.param]
+
+    @pytest.fixture(autouse=True)
+    async def setup_registry_auth(self, general_cache):
+        """Store valid docker.io credentials; the per-test cache is discarded afterwards, so no cleanup.
 
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "POST /images/import": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-import-123"},
-                headers=(("Location", "/v1/operations/op-import-123"),),
-            ),
-        }
+        Only docker.io is set up, the anonymous tests rely on quay.io having no credentials.
+        """
+        await general_cache.put(
+            kind="registry_token",
+            key="docker.io",
+            data={
+                "registry": "docker.io",
+                "username": "testuser",
+                "token": "testtoken",
+                "scopes": ["pull"],
+                "created_at": "2025-01-01T00:00:00Z",
+            },
+        )
+        with patch.object(RegistryAuth, "validate_token", new=AsyncMock(return_value=True)):
+            yield
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fake_responses", ["wait_false"], indirect=True)
     async def test_import_with_wait_false(self) -> None:
         """Test import returns operation_id when wait=false."""
         result = await import_image(registry_url="docker.io/library/python:3.11-slim", wait=False)
         assert isinstance(result, dict)
         assert result.get("operation_id") == "op-import-123"
 
-
-class TestImportImageWaitTrue(TestCase):
-    """Test import_image with wait=true."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "POST /images/import": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-import-wait-123"},
-                headers=(("Location", "/v1/operations/op-import-wait-123"),),
-            ),
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-import-wait-123",
-                    "kind": OperationKind.IMAGE_IMPORT.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "error": None,
-                    "metadata": {
-                        "registry": {"url": "docker.io/library/python:3.11-slim"},
-                        "tag": "python:3.11",
-                        "timeout": 300,
-                    },
-                    "result": OperationResult(image="img-imported-result", tag="python:3.11"),
-                }
-            ),
-        }
-
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fake_responses", ["wait_true"], indirect=True)
     async def test_import_with_wait_true(self) -> None:
         """Test import waits and returns OperationResponse when wait=true."""
         result = await import_image(
@@ -98,7 +114,7 @@ class TestImportImageWaitTrue(TestCase):
         assert result.result.image == "img-imported-result"
         assert result.result.tag == "python:3.11"
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fake_responses", ["wait_true"], indirect=True)
     async def test_import_saves_to_cache(self, general_cache) -> None:
         """Test import saves imported image to cache."""
         result = await import_image(
@@ -114,31 +130,7 @@ class TestImportImageWaitTrue(TestCase):
         assert cached_image.data["is_import"] is True
         assert cached_image.data["registry_url"] == "docker.io/library/alpine:latest"
 
-
-class TestImportImageNoResult(TestCase):
-    """Test import_image when no result image is returned."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "POST /images/import": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-import-fail-123"},
-                headers=(("Location", "/v1/operations/op-import-fail-123"),),
-            ),
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-import-fail-123",
-                    "kind": OperationKind.IMAGE_IMPORT.value,
-                    "status": OperationStatus.FAILED.value,
-                    "error": "Image not found",
-                    "metadata": None,
-                    "result": None,
-                }
-            ),
-        }
-
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fake_responses", ["no_result"], indirect=True)
     async def test_import_failed_no_result(self, general_cache) -> None:
         """Test import failure doesn't save to cache."""
         result = await import_image(
@@ -153,6 +145,28 @@ class TestImportImageNoResult(TestCase):
         cached_images = await general_cache.list_entries("image")
         assert len(cached_images) == 0
 
+    @pytest.mark.parametrize("fake_responses", ["anonymous"], indirect=True)
+    async def test_anonymous_import_without_credentials(self) -> None:
+        """Test anonymous import works without stored credentials."""
+        result = await import_image(
+            registry_url="docker://quay.io/prometheus/prometheus:latest",
+            wait=False,
+            i_accept_that_anonymous_access_might_be_rate_limited=True,
+        )
+        assert isinstance(result, dict)
+        assert result.get("operation_id") == "op-import-anon-123"
+
+    @pytest.mark.parametrize("fake_responses", ["anonymous"], indirect=True)
+    async def test_anonymous_import_raises_without_flag(self) -> None:
+        """Test import raises error without anonymous flag when no credentials."""
+        with pytest.raises(RegistryAuthenticationError) as exc_info:
+            await import_image(
+                registry_url="docker://quay.io/prometheus/prometheus:latest",
+                wait=False,
+            )
+
+        assert "quay.io" in str(exc_info.value)
+
 
 class TestImportImageTokenExpired(TestCase):
     """Test import_image when cached token is expired."""
@@ -175,11 +189,8 @@ class TestImportImageTokenExpired(TestCase):
         # Token should be deleted by import_image, but clean up just in case
         await general_cache.delete(kind="registry_token", key="ghcr.io")
 
-    @pytest.mark.asyncio
     async def test_expired_token_removed_from_cache(self, general_cache) -> None:
         """Test expired token is removed from cache and raises error."""
-        from contree_mcp.tools.import_image import RegistryAuthenticationError
-
         with patch.object(RegistryAuth, "validate_token", new=AsyncMock(return_value=False)):
             with pytest.raises(RegistryAuthenticationError) as exc_info:
                 await import_image(registry_url="docker://ghcr.io/org/image:latest", wait=False)
@@ -189,47 +200,3 @@ class TestImportImageTokenExpired(TestCase):
         # Verify token was removed from cache
         entry = await general_cache.get(kind="registry_token", key="ghcr.io")
         assert entry is None
-
-
-class TestImportImageAnonymous(TestCase):
-    """Test import_image with anonymous access."""
-
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "POST /images/import": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-import-anon-123"},
-                headers=(("Location", "/v1/operations/op-import-anon-123"),),
-            ),
-        }
-
-    @pytest.mark.asyncio
-    async def test_anonymous_import_without_credentials(self, general_cache) -> None:
-        """Test anonymous import works without stored credentials."""
-        # Ensure no credentials exist for this registry
-        await general_cache.delete(kind="registry_token", key="quay.io")
-
-        result = await import_image(
-            registry_url="docker://quay.io/prometheus/prometheus:latest",
-            wait=False,
-            i_accept_that_anonymous_access_might_be_rate_limited=True,
-        )
-        assert isinstance(result, dict)
-        assert result.get("operation_id") == "op-import-anon-123"
-
-    @pytest.mark.asyncio
-    async def test_anonymous_import_raises_without_flag(self, general_cache) -> None:
-        """Test import raises error without anonymous flag when no credentials."""
-        from contree_mcp.tools.import_image import RegistryAuthenticationError
-
-        # Ensure no credentials exist for this registry
-        await general_cache.delete(kind="registry_token", key="quay.io")
-
-        with pytest.raises(RegistryAuthenticationError) as exc_info:
-            await import_image(
-                registry_url="docker://quay.io/prometheus/prometheus:latest",
-                wait=False,
-            )
-
-        assert "quay.io" in str(exc_info.value)
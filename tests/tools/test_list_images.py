@@ -3,60 +3,42 @@ from http import HTTPStatus
 import pytest
 
 from contree_mcp.backend_types import Image
+from contree_mcp.client import ContreeError
 from contree_mcp.tools.list_images import list_images
 from tests.conftest import FakeResponse, FakeResponses
 
 from . import TestCase
 
+IMAGES = [
+    Image(uuid="img-1", tag="python:3.11", created_at="2024-01-01T00:00:00Z"),
+    Image(uuid="img-2", tag=None, created_at="2024-01-01T00:00:00Z"),
+]
 
-class TestListImagesHappyPath(TestCase):
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
-        return {
-            "GET /images": FakeResponse(
-                body={
-                    "images": [
-                        Image(uuid="img-1", tag="python:3.11", created_at="2024-01-01T00:00:00Z"),
-                        Image(uuid="img-2", tag=None, created_at="2024-01-01T00:00:00Z"),
-                    ]
-                }
-            ),
-        }
-
-    @pytest.mark.asyncio
-    async def test_basic_usage(self) -> None:
-        result = await list_images()
 
-        assert len(result.images) == 2
-        assert result.images[0].uuid == "img-1"
-        assert result.images[0].tag == "python:3.11"
-        assert result.images[1].uuid == "img-2"
-        assert result.images[1].tag is None
-
-    @pytest.mark.asyncio
-    async def test_output_type_correct(self) -> None:
-        result = await list_images()
-
-        assert isinstance(result.images, list)
-        for img in result.images:
-            assert isinstance(img, Image)
-
-
-class TestListImagesEdgeCases(TestCase):
-    @pytest.fixture
-    def fake_responses(self) -> FakeResponses:
+class TestListImages(TestCase):
+    @pytest.fixture(scope="class")
+    def fake_responses(self, request: pytest.FixtureRequest) -> FakeResponses:
         return {
-            "GET /images": FakeResponse(body={"images": []}),
+            "GET /images": FakeResponse(body={"images": request.param}),
         }
 
-    @pytest.mark.asyncio
-    async def test_empty_result(self) -> None:
+    @pytest.mark.parametrize(
+        "fake_responses,expected",
+        [
+            pytest.param(IMAGES, [("img-1", "python:3.11"), ("img-2", None)], id="images"),
+            pytest.param([], [], id="empty"),
+        ],
+        indirect=["fake_responses"],
+    )
+    async def test_list_images(self, expected: list[tuple[str, str | None]]) -> None:
         result = await list_images()
-        assert result.images == []
+
+        assert all(isinstance(img, Image) for img in result.images)
+        assert [(img.uuid, img.tag) for img in result.images] == expected
 
 
 class TestListImagesErrorHandling(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /images": FakeResponse(
@@ -65,7 +47,6 @@ class TestListImagesErrorHandling(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_api_error_propagated(self) -> None:
-        with pytest.raises(Exception):  # noqa: B017
+        with pytest.raises(ContreeError, match="API Error"):
             await list_images()
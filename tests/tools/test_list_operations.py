@@ -8,7 +8,7 @@ from . import TestCase
 
 
 class TestListOperations(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations": FakeResponse(
@@ -26,7 +26,6 @@ class TestListOperations(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_basic_usage(self) -> None:
         result = await list_operations()
 
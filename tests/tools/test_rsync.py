@@ -1,4 +1,3 @@
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -11,16 +10,14 @@ from . import TestCase
 
 
 class TestRsyncValidation(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {}
 
-    @pytest.mark.asyncio
     async def test_rejects_relative_source_path(self):
         with pytest.raises(ValueError, match="absolute path"):
             await rsync(source="relative/path", destination="/app")
 
-    @pytest.mark.asyncio
     async def test_rejects_nonexistent_source_path(self, tmp_path: Path):
         nonexistent = str(tmp_path / "nonexistent")
         with pytest.raises(ValueError, match="source path does not exist"):
@@ -28,22 +25,22 @@ class TestRsyncValidation(TestCase):
 
 
 class TestRsync(TestCase):
-    @pytest.fixture
-    def temp_project_dir(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            Path(tmpdir, "main.py").write_text("print('hello')")
-            Path(tmpdir, "utils.py").write_text("def helper(): pass")
-            Path(tmpdir, "subdir").mkdir()
-            Path(tmpdir, "subdir", "module.py").write_text("class Foo: pass")
-            yield tmpdir
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    def temp_project_dir(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        """Source tree shared by the class, rsync only reads it."""
+        project = tmp_path_factory.mktemp("project")
+        (project / "main.py").write_text("print('hello')")
+        (project / "utils.py").write_text("def helper(): pass")
+        (project / "subdir").mkdir()
+        (project / "subdir" / "module.py").write_text("class Foo: pass")
+        return str(project)
+
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body=FileResponse(uuid="file-123", sha256="abc123def456")),
         }
 
-    @pytest.mark.asyncio
     async def test_basic_sync(self, temp_project_dir: str) -> None:
         result = await rsync(
             source=temp_project_dir,
@@ -54,7 +51,6 @@ class TestRsync(TestCase):
         assert isinstance(result, int)
         assert result > 0
 
-    @pytest.mark.asyncio
     async def test_sync_with_exclude_patterns(self, temp_project_dir: str) -> None:
         """Test rsync works with exclude patterns - regression test for UNIQUE constraint bug."""
         # First sync without exclude
@@ -78,7 +74,6 @@ class TestRsync(TestCase):
         # Different exclude patterns should produce different directory states
         assert result1 != result2
 
-    @pytest.mark.asyncio
     async def test_sync_with_multiple_exclude_patterns(self, temp_project_dir: str) -> None:
         """Test rsync with multiple exclude patterns."""
         result = await rsync(
@@ -89,7 +84,6 @@ class TestRsync(TestCase):
         assert isinstance(result, int)
         assert result > 0
 
-    @pytest.mark.asyncio
     async def test_repeated_sync_same_params_returns_same_id(self, temp_project_dir: str) -> None:
         """Test that repeated syncs with same params return same directory state."""
         result1 = await rsync(
@@ -20,20 +20,83 @@ from tests.conftest import FakeResponse, FakeResponses
 from . import TestCase
 
 
+def accepted_instance(operation_id: str) -> FakeResponse:
+    """Response of the instances endpoint accepting a new run operation."""
+    return FakeResponse(
+        http_status=HTTPStatus.ACCEPTED,
+        body={"uuid": operation_id},
+        headers=(("Location", f"/v1/operations/{operation_id}"),),
+    )
+
+
+WAIT_OPERATION_BODY = {
+    "uuid": "op-wait-123",
+    "kind": OperationKind.INSTANCE.value,
+    "status": OperationStatus.SUCCESS.value,
+    "created_at": "2024-01-01T00:00:00Z",
+    "error": None,
+    "metadata": {
+        "command": "echo hello",
+        "image": "00000000-0000-0000-0000-000000000001",
+        "result": InstanceResult(
+            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
+            stdout=Stream(value="hello world", encoding="ascii"),
+            stderr=Stream(value="", encoding="ascii"),
+            resources=ConsumedResources(elapsed_time=0.5),
+        ),
+    },
+    "result": OperationResult(image="img-result-wait", tag=None),
+}
+
+DIRECTORY_STATE_OPERATION_BODY = {
+    "uuid": "op-ds-123",
+    "kind": OperationKind.INSTANCE.value,
+    "status": OperationStatus.SUCCESS.value,
+    "created_at": "2024-01-01T00:00:00Z",
+    "error": None,
+    "metadata": {
+        "command": "python /app/script.py",
+        "image": "00000000-0000-0000-0000-000000000001",
+        "result": InstanceResult(
+            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
+            stdout=Stream(value="file executed", encoding="ascii"),
+            stderr=Stream(value="", encoding="ascii"),
+            resources=ConsumedResources(elapsed_time=1.0),
+        ),
+    },
+    "result": OperationResult(image="img-ds-result", tag=None),
+}
+
+LINEAGE_OPERATION_BODY = {
+    "uuid": "op-lineage-123",
+    "kind": OperationKind.INSTANCE.value,
+    "status": OperationStatus.SUCCESS.value,
+    "created_at": "2024-01-01T00:00:00Z",
+    "error": None,
+    "metadata": {
+        "command": "apt-get install -y python",
+        "image": "00000000-0000-0000-0000-000000000002",
+        "result": InstanceResult(
+            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
+            stdout=Stream(value="", encoding="ascii"),
+            stderr=Stream(value="", encoding="ascii"),
+            resources=ConsumedResources(elapsed_time=0.5),
+        ),
+    },
+    # Different result_image to trigger lineage save
+    "result": OperationResult(image="img-new-lineage", tag=None),
+}
+
+
 class TestRunCommandBasic(TestCase):
     """Test basic run_command functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "POST /instances": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-run-123"},
-                headers=(("Location", "/v1/operations/op-run-123"),),
-            ),
+            "POST /instances": accepted_instance("op-run-123"),
         }
 
-    @pytest.mark.asyncio
     async def test_basic_command_wait_false(self) -> None:
         """Test basic command with wait=false returns operation_id."""
         result = await run(command="echo hello", image="00000000-0000-0000-0000-000000000001", wait=False)
@@ -44,37 +107,13 @@ class TestRunCommandBasic(TestCase):
 class TestRunCommandWithWait(TestCase):
     """Test run_command with wait=true."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "POST /instances": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-wait-123"},
-                headers=(("Location", "/v1/operations/op-wait-123"),),
-            ),
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-wait-123",
-                    "kind": OperationKind.INSTANCE.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "error": None,
-                    "metadata": {
-                        "command": "echo hello",
-                        "image": "00000000-0000-0000-0000-000000000001",
-                        "result": InstanceResult(
-                            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
-                            stdout=Stream(value="hello world", encoding="ascii"),
-                            stderr=Stream(value="", encoding="ascii"),
-                            resources=ConsumedResources(elapsed_time=0.5),
-                        ),
-                    },
-                    "result": OperationResult(image="img-result-wait", tag=None),
-                }
-            ),
+            "POST /instances": accepted_instance("op-wait-123"),
+            "GET /operations/{uuid}": FakeResponse(body=WAIT_OPERATION_BODY),
         }
 
-    @pytest.mark.asyncio
     async def test_command_with_wait_true(self) -> None:
         """Test command with wait=true returns OperationResponse."""
         result = await run(command="echo hello", image="00000000-0000-0000-0000-000000000001", wait=True)
@@ -87,37 +126,13 @@ class TestRunCommandWithWait(TestCase):
 class TestRunCommandWithDirectoryState(TestCase):
     """Test run_command with directory_state_id."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "POST /instances": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-ds-123"},
-                headers=(("Location", "/v1/operations/op-ds-123"),),
-            ),
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-ds-123",
-                    "kind": OperationKind.INSTANCE.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "error": None,
-                    "metadata": {
-                        "command": "python /app/script.py",
-                        "image": "00000000-0000-0000-0000-000000000001",
-                        "result": InstanceResult(
-                            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
-                            stdout=Stream(value="file executed", encoding="ascii"),
-                            stderr=Stream(value="", encoding="ascii"),
-                            resources=ConsumedResources(elapsed_time=1.0),
-                        ),
-                    },
-                    "result": OperationResult(image="img-ds-result", tag=None),
-                }
-            ),
+            "POST /instances": accepted_instance("op-ds-123"),
+            "GET /operations/{uuid}": FakeResponse(body=DIRECTORY_STATE_OPERATION_BODY),
         }
 
-    @pytest.mark.asyncio
     async def test_with_directory_state(self) -> None:
         """Test command with directory_state_id loads files."""
         files_cache = FILES_CACHE.get()
@@ -143,7 +158,6 @@ class TestRunCommandWithDirectoryState(TestCase):
         assert isinstance(result, OperationResponse)
         assert result.status == OperationStatus.SUCCESS
 
-    @pytest.mark.asyncio
     async def test_with_invalid_directory_state(self) -> None:
         """Test command with invalid directory_state_id raises error."""
         with pytest.raises(ValueError, match="Directory state not found"):
@@ -154,7 +168,6 @@ class TestRunCommandWithDirectoryState(TestCase):
                 wait=False,
             )
 
-    @pytest.mark.asyncio
     async def test_with_empty_directory_state(self) -> None:
         """Test command with empty directory_state raises error."""
         files_cache = FILES_CACHE.get()
@@ -179,17 +192,12 @@ class TestRunCommandWithDirectoryState(TestCase):
 class TestRunCommandWithFiles(TestCase):
     """Test run_command with files parameter."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "POST /instances": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-files-123"},
-                headers=(("Location", "/v1/operations/op-files-123"),),
-            ),
+            "POST /instances": accepted_instance("op-files-123"),
         }
 
-    @pytest.mark.asyncio
     async def test_with_files_param(self) -> None:
         """Test command with direct file UUIDs."""
         result = await run(
@@ -205,38 +213,13 @@ class TestRunCommandWithFiles(TestCase):
 class TestRunCommandLineage(TestCase):
     """Test run_command saves image lineage."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
-            "POST /instances": FakeResponse(
-                http_status=HTTPStatus.ACCEPTED,
-                body={"uuid": "op-lineage-123"},
-                headers=(("Location", "/v1/operations/op-lineage-123"),),
-            ),
-            "GET /operations/{uuid}": FakeResponse(
-                body={
-                    "uuid": "op-lineage-123",
-                    "kind": OperationKind.INSTANCE.value,
-                    "status": OperationStatus.SUCCESS.value,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "error": None,
-                    "metadata": {
-                        "command": "apt-get install -y python",
-                        "image": "00000000-0000-0000-0000-000000000002",
-                        "result": InstanceResult(
-                            state=ProcessExitState(exit_code=0, pid=1, timed_out=False),
-                            stdout=Stream(value="", encoding="ascii"),
-                            stderr=Stream(value="", encoding="ascii"),
-                            resources=ConsumedResources(elapsed_time=0.5),
-                        ),
-                    },
-                    # Different result_image to trigger lineage save
-                    "result": OperationResult(image="img-new-lineage", tag=None),
-                }
-            ),
+            "POST /instances": accepted_instance("op-lineage-123"),
+            "GET /operations/{uuid}": FakeResponse(body=LINEAGE_OPERATION_BODY),
         }
 
-    @pytest.mark.asyncio
     async def test_saves_image_lineage(self, general_cache) -> None:
         """Test that run_command saves image lineage when image changes."""
         result = await run(
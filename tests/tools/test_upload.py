@@ -9,49 +9,40 @@ from tests.conftest import FakeResponse, FakeResponses
 
 from . import TestCase
 
+BINARY_CONTENT_BASE64 = base64.b64encode(b"\x00\x01\x02\xff\xfe").decode("ascii")
+
 
 class TestUploadHappyPath(TestCase):
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "POST /files": FakeResponse(body=FileResponse(uuid="file-123", sha256="abc123def456")),
         }
 
-    @pytest.mark.asyncio
-    async def test_upload_from_path(self, tmp_path: Path) -> None:
-        f = tmp_path / "uploading-file.txt"
-        f.write_text("test content")
-        result = await upload(path=str(f))
+    @pytest.fixture(scope="class")
+    def uploading_file(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        path = tmp_path_factory.mktemp("upload") / "uploading-file.txt"
+        path.write_text("test content")
+        return path
+
+    @pytest.mark.parametrize("source", ["path", "content", "content_base64"])
+    async def test_upload(self, source: str, uploading_file: Path) -> None:
+        sources = {
+            "path": str(uploading_file),
+            "content": "hello world",
+            "content_base64": BINARY_CONTENT_BASE64,
+        }
+        result = await upload(**{source: sources[source]})
+        assert isinstance(result, FileResponse)
         assert result.uuid == "file-123"
         assert result.sha256 == "abc123def456"
 
-    @pytest.mark.asyncio
-    async def test_upload_from_content(self) -> None:
-        result = await upload(content="hello world")
-        assert result.uuid == "file-123"
-
-    @pytest.mark.asyncio
-    async def test_upload_from_base64(self) -> None:
-        binary_data = b"\x00\x01\x02\xff\xfe"
-        encoded = base64.b64encode(binary_data).decode("ascii")
-        result = await upload(content_base64=encoded)
-        assert result.uuid == "file-123"
-
-    @pytest.mark.asyncio
-    async def test_output_type_correct(self) -> None:
-        result = await upload(content="test")
-        assert isinstance(result, FileResponse)
-        assert hasattr(result, "uuid")
-        assert hasattr(result, "sha256")
-
 
 class TestUploadErrorHandling:
-    @pytest.mark.asyncio
     async def test_no_input_provided(self) -> None:
         with pytest.raises(ValueError, match="One of 'path', 'content', or 'content_base64' is required"):
             await upload()
 
-    @pytest.mark.asyncio
     async def test_file_not_found(self) -> None:
         with pytest.raises(ValueError, match="File not found"):
             await upload(path="/nonexistent/path/file.txt")
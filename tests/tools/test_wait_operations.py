@@ -1,3 +1,7 @@
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
 import pytest
 
 from contree_mcp.backend_types import (
@@ -19,7 +23,7 @@ from . import TestCase
 class TestWaitOperationsFromAPI(TestCase):
     """Test wait_operations fetching from API."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -44,14 +48,12 @@ class TestWaitOperationsFromAPI(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_single_operation(self) -> None:
         result = await wait_operations(operation_ids=["op-1"])
         assert isinstance(result, WaitOperationsOutput)
         assert "op-1" in result.completed
         assert result.timed_out is False
 
-    @pytest.mark.asyncio
     async def test_wait_multiple_operations(self) -> None:
         """Test waiting for multiple operations."""
         result = await wait_operations(operation_ids=["op-1", "op-2", "op-3"])
@@ -61,7 +63,6 @@ class TestWaitOperationsFromAPI(TestCase):
         assert result.cancelled == []
         assert result.timed_out is False
 
-    @pytest.mark.asyncio
     async def test_wait_mode_any(self) -> None:
         """Test mode='any' returns on first completion."""
         result = await wait_operations(
@@ -75,7 +76,7 @@ class TestWaitOperationsFromAPI(TestCase):
 class TestWaitOperationsFailedOps(TestCase):
     """Test wait_operations with failed operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -91,7 +92,6 @@ class TestWaitOperationsFailedOps(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_failed_operation(self) -> None:
         """Test waiting for a failed operation."""
         result = await wait_operations(operation_ids=["op-fail-wait"])
@@ -104,7 +104,7 @@ class TestWaitOperationsFailedOps(TestCase):
 class TestWaitOperationsCancelled(TestCase):
     """Test wait_operations with cancelled operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -120,7 +120,6 @@ class TestWaitOperationsCancelled(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_cancelled_operation(self) -> None:
         """Test waiting for a cancelled operation."""
         result = await wait_operations(operation_ids=["op-cancelled"])
@@ -131,7 +130,7 @@ class TestWaitOperationsCancelled(TestCase):
 class TestWaitTrackedOperations(TestCase):
     """Test wait_operations with tracked operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -146,7 +145,6 @@ class TestWaitTrackedOperations(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_tracked_operation(self) -> None:
         """Test waiting for a tracked operation."""
         client = CLIENT.get()
@@ -160,7 +158,6 @@ class TestWaitTrackedOperations(TestCase):
         assert "op-tracked-1" in result.completed
         assert result.timed_out is False
 
-    @pytest.mark.asyncio
     async def test_wait_tracked_operation_mode_any(self) -> None:
         """Test mode='any' with tracked operations returns early."""
         client = CLIENT.get()
@@ -183,7 +180,7 @@ class TestWaitTrackedOperations(TestCase):
 class TestWaitUntrackedPolling(TestCase):
     """Test wait_operations polling for untracked operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         # First call returns EXECUTING, second returns SUCCESS
         return {
@@ -199,7 +196,6 @@ class TestWaitUntrackedPolling(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_untracked_polling(self) -> None:
         """Test polling for untracked operations."""
         result = await wait_operations(
@@ -209,7 +205,6 @@ class TestWaitUntrackedPolling(TestCase):
         assert "op-untracked-poll" in result.completed
         assert result.timed_out is False
 
-    @pytest.mark.asyncio
     async def test_wait_untracked_mode_any(self) -> None:
         """Test mode='any' breaks early for untracked operations."""
         result = await wait_operations(
@@ -225,7 +220,7 @@ class TestWaitUntrackedPolling(TestCase):
 class TestWaitOperationsPollingSuccess(TestCase):
     """Test wait_operations when operation completes successfully."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -240,7 +235,6 @@ class TestWaitOperationsPollingSuccess(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_operation_success(self) -> None:
         """Test waiting for operation that completes successfully."""
         result = await wait_operations(
@@ -253,10 +247,8 @@ class TestWaitOperationsPollingSuccess(TestCase):
 class TestWaitOperationsPollingError(TestCase):
     """Test wait_operations when polling raises an exception."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
-        from http import HTTPStatus
-
         return {
             "GET /operations/{uuid}": FakeResponse(
                 http_status=HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -264,7 +256,6 @@ class TestWaitOperationsPollingError(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_polling_exception(self) -> None:
         """Test that polling exceptions are handled gracefully."""
         result = await wait_operations(
@@ -280,7 +271,7 @@ class TestWaitOperationsPollingError(TestCase):
 class TestWaitOperationsTimeout(TestCase):
     """Test wait_operations timeout scenarios."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -297,7 +288,6 @@ class TestWaitOperationsTimeout(TestCase):
             "DELETE /operations/{uuid}": FakeResponse(body={"uuid": "op-timeout", "status": "CANCELLED"}),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_timeout_untracked(self) -> None:
         """Test timeout for untracked operations that never complete."""
         result = await wait_operations(
@@ -311,7 +301,6 @@ class TestWaitOperationsTimeout(TestCase):
         assert op_result.status == OperationStatus.FAILED
         assert "timed out" in str(op_result.error)
 
-    @pytest.mark.asyncio
     async def test_wait_timeout_mode_any(self) -> None:
         """Test timeout with mode='any' when nothing completes."""
         result = await wait_operations(
@@ -323,10 +312,37 @@ class TestWaitOperationsTimeout(TestCase):
         assert len(result.completed) >= 1 or result.timed_out
 
 
+class TestWaitOperationsCallerCancelled(TestCase):
+    """Test cancelling wait_operations itself."""
+
+    async def test_cancelled_wait_cancels_waiters(self) -> None:
+        """Test that cancelling the call also cancels its per-operation waiters."""
+        client = CLIENT.get()
+        started = asyncio.Event()
+        cancelled: list[str] = []
+
+        async def hanging_wait(op_id: str, max_wait: float | None = None) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(op_id)
+                raise
+
+        with patch.object(client, "wait_for_operation", side_effect=hanging_wait):
+            task = asyncio.create_task(wait_operations(operation_ids=["op-hanging"]))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert cancelled == ["op-hanging"]
+
+
 class TestWaitModeAnyCancellation(TestCase):
     """Test that mode='any' explicitly cancels remaining backend operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             # op-fast completes immediately
@@ -359,11 +375,8 @@ class TestWaitModeAnyCancellation(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_mode_any_cancels_remaining_operations(self) -> None:
         """Test that mode='any' cancels backend operations not in results."""
-        from unittest.mock import patch
-
         client = CLIENT.get()
         original_cancel = client.cancel_operation
 
@@ -396,7 +409,7 @@ class TestWaitModeAnyCancellation(TestCase):
 class TestWaitMixedOperations(TestCase):
     """Test wait_operations with multiple operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def fake_responses(self) -> FakeResponses:
         return {
             "GET /operations/{uuid}": FakeResponse(
@@ -411,7 +424,6 @@ class TestWaitMixedOperations(TestCase):
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_wait_multiple_operations(self) -> None:
         """Test waiting for multiple operations."""
         result = await wait_operations(
@@ -422,7 +434,6 @@ class TestWaitMixedOperations(TestCase):
         assert result.cancelled == []
         assert result.timed_out is False
 
-    @pytest.mark.asyncio
     async def test_wait_mixed_tracked_and_untracked(self) -> None:
         """Test waiting for mix of tracked and untracked operations."""
         client = CLIENT.get()